@@ -0,0 +1,179 @@
+import atexit
+import csv
+import json
+import queue
+import threading
+
+
+class BufferedLogger:
+    """
+    Drop-in replacement for Logger that writes records in batches on a
+    background thread.
+
+    log() only appends to an in-memory buffer. Full buffers of flush_size
+    records go to a bounded queue that a writer thread drains, so the
+    simulation loop never waits on file I/O unless the writer falls more than
+    max_pending batches behind. Partially filled buffers are written every
+    flush_interval seconds, and everything is flushed on close() or at
+    interpreter exit.
+
+    Args:
+        log_file (str): Output path.
+        format (str): 'jsonl' (one JSON object per line) or 'csv' (header taken
+            from the first record).
+        flush_size (int): Records per batch.
+        flush_interval (float): Seconds before a partial batch is written.
+        max_pending (int): Bound on batches waiting for the writer thread.
+        append (bool): Keep the existing file and add to it (to resume a
+            checkpointed run) instead of starting it over.
+    """
+
+    def __init__(self, log_file="simulation_log.jsonl", format="jsonl", flush_size=10000,
+                 flush_interval=1.0, max_pending=8, append=False):
+        if format not in {"jsonl", "csv"}:
+            raise ValueError(f"Unknown log format '{format}'. Choose 'jsonl' or 'csv'.")
+        self.log_file = log_file
+        self.format = format
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+
+        self._buffer = []
+        self._buffer_lock = threading.Lock()
+        self._file_lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._file = open(log_file, "a" if append else "w", newline="")
+        self._csv_writer = None
+        self._error = None
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._write_loop, name="BufferedLogger", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def log(self, record):
+        """
+        Buffers one record (a dict); a full buffer is handed to the writer thread.
+        """
+        if self._error:
+            raise self._error
+        with self._buffer_lock:
+            self._buffer.append(record)
+            if len(self._buffer) < self.flush_size:
+                return
+            batch, self._buffer = self._buffer, []
+        self._queue.put(batch)  # Blocks only if the writer is max_pending batches behind
+
+    def flush(self):
+        """
+        Writes every buffered record and waits until the writer has caught up.
+        """
+        with self._buffer_lock:
+            batch, self._buffer = self._buffer, []
+        if batch:
+            self._queue.put(batch)
+        self._queue.join()
+        with self._file_lock:
+            self._file.flush()
+        if self._error:
+            raise self._error
+
+    def reset_log(self):
+        """
+        Discards anything logged so far and starts the log file over.
+        """
+        self.flush()
+        with self._file_lock:
+            self._file.seek(0)
+            self._file.truncate()
+            self._csv_writer = None
+
+    def checkpoint(self):
+        """
+        Flushes everything logged so far and returns the file offset, for resume().
+        """
+        self.flush()
+        with self._file_lock:
+            return self._file.tell()
+
+    def resume(self, offset):
+        """
+        Cuts the file back to an offset returned by checkpoint(), dropping
+        records logged after that checkpoint, and continues from there.
+        """
+        self.flush()
+        with self._file_lock:
+            self._file.truncate(offset)
+            self._file.seek(offset)
+            self._csv_writer = None
+
+    def close(self):
+        """
+        Flushes all records, stops the writer thread and closes the file. Safe to call twice.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.flush()
+        finally:
+            self._queue.put(None)
+            self._thread.join()
+            self._file.close()
+            atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write_loop(self):
+        while True:
+            try:
+                batch = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                # Interval flush: queue the partially filled buffer like a full one
+                with self._buffer_lock:
+                    if self._buffer:
+                        try:
+                            self._queue.put_nowait(self._buffer)
+                            self._buffer = []
+                        except queue.Full:
+                            pass  # The producer just queued batches, they come first
+                continue
+            try:
+                if batch is None:
+                    return
+                self._write(batch)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, batch):
+        try:
+            with self._file_lock:
+                if self.format == "jsonl":
+                    self._file.write("".join(json.dumps(record) + "\n" for record in batch))
+                else:
+                    if self._csv_writer is None:
+                        self._csv_writer = csv.DictWriter(self._file, fieldnames=list(batch[0]))
+                        if self._file.tell() == 0:  # Appended logs already have their header
+                            self._csv_writer.writeheader()
+                    self._csv_writer.writerows(batch)
+        except Exception as error:  # Surface writer failures to the simulation thread
+            self._error = error
+
+
+class NullLogger:
+    """
+    Logger that discards every record, for runs that only need the metrics
+    (parameter sweeps, batch runs without --log).
+    """
+
+    def log(self, record):
+        pass
+
+    def reset_log(self):
+        pass
+
+    def close(self):
+        pass
@@ -0,0 +1,215 @@
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from functools import partial
+
+from scheduler import fcfs, sjf_non_preemptive, round_robin, priority_non_preemptive, mlfq
+from workload import generate_workload
+
+ALGORITHMS = {
+    "fcfs": fcfs,
+    "sjf": sjf_non_preemptive,
+    "rr": partial(round_robin, time_quantum=4),
+    "priority": priority_non_preemptive,
+    "mlfq": mlfq,
+}
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+METRICS = ("wall_time", "peak_memory")  # Lower is better; compared against the baseline
+
+
+def count_events(algorithm, workload):
+    """
+    Runs the algorithm once on a copy of the workload and counts its events:
+    one arrival per process plus one dispatch per executed slice. Slices are
+    counted through on_progress where the algorithm has it (Round Robin,
+    MLFQ); the others run every process in a single slice.
+
+    Returns:
+        tuple: (event count, peak traced memory in bytes)
+    """
+    processes = workload.copy()
+    slices = 0
+
+    def count_slice(process, executed):
+        nonlocal slices
+        slices += 1
+
+    function = getattr(algorithm, "func", algorithm)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        if function in (round_robin, mlfq):
+            algorithm(processes, on_progress=count_slice)
+        else:
+            algorithm(processes)
+            slices = len(processes)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return len(processes) + slices, peak_memory
+
+
+def benchmark(name, workload, repeat=3):
+    """
+    Benchmarks one algorithm on one workload.
+
+    The wall time is the best of repeat timed runs, each on a fresh copy of
+    the workload with copying excluded. Peak memory and the event count come
+    from a separate traced run, so tracing overhead never enters the timing.
+
+    Args:
+        name (str): Key of ALGORITHMS.
+        workload (ProcessTable): Workload to schedule; it is never modified.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        dict: algorithm, processes, wall_time (s), peak_memory (bytes), events,
+            events_per_second and processes_per_second.
+    """
+    algorithm = ALGORITHMS[name]
+    events, peak_memory = count_events(algorithm, workload)
+
+    wall_time = None
+    for _ in range(repeat):
+        processes = workload.copy()
+        gc.collect()
+        start = time.perf_counter()
+        algorithm(processes)
+        elapsed = time.perf_counter() - start
+        wall_time = elapsed if wall_time is None else min(wall_time, elapsed)
+
+    return {
+        "algorithm": name,
+        "processes": len(workload),
+        "wall_time": wall_time,
+        "peak_memory": peak_memory,
+        "events": events,
+        "events_per_second": events / wall_time if wall_time else None,
+        "processes_per_second": len(workload) / wall_time if wall_time else None,
+    }
+
+
+def run_benchmarks(algorithms=tuple(ALGORITHMS), sizes=SIZES, repeat=3, seed=0, on_result=None, **workload_options):
+    """
+    Benchmarks every algorithm on a generated workload of each size. The same
+    seed gives the same workloads, so runs are comparable across commits.
+
+    Args:
+        algorithms (sequence): Keys of ALGORITHMS.
+        sizes (sequence): Workload sizes (number of processes).
+        repeat (int): Timed runs per benchmark.
+        seed (int): Workload seed.
+        on_result (function): Optional callback(result) run after each benchmark.
+        **workload_options: Passed on to generate_workload.
+
+    Returns:
+        list: One result dict per (size, algorithm).
+    """
+    results = []
+    for size in sizes:
+        workload = generate_workload(size, seed=seed, **workload_options)
+        for name in algorithms:
+            result = benchmark(name, workload, repeat)
+            results.append(result)
+            if on_result:
+                on_result(result)
+    return results
+
+
+def load_baseline(path):
+    """
+    Reads a baseline written by save_baseline, keyed by "algorithm/processes".
+    """
+    with open(path) as baseline:
+        return json.load(baseline)
+
+
+def save_baseline(results, path):
+    """
+    Writes benchmark results as the baseline for later comparisons. Entries
+    for configurations that were not re-run are kept.
+    """
+    baseline = load_baseline(path) if os.path.isfile(path) else {}
+    for result in results:
+        baseline[f"{result['algorithm']}/{result['processes']}"] = result
+    with open(path, "w") as output:
+        json.dump(baseline, output, indent=2, sort_keys=True)
+        output.write("\n")
+
+
+def compare(results, baseline, tolerance=0.25):
+    """
+    Compares results with a baseline.
+
+    Args:
+        results (list): Results from run_benchmarks.
+        baseline (dict): Baseline from load_baseline.
+        tolerance (float): Allowed relative increase before a metric counts as a regression.
+
+    Returns:
+        list: (key, metric, baseline value, new value, relative change) for every regression.
+    """
+    regressions = []
+    for result in results:
+        key = f"{result['algorithm']}/{result['processes']}"
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        for metric in METRICS:
+            if previous.get(metric):
+                change = result[metric] / previous[metric] - 1
+                if change > tolerance:
+                    regressions.append((key, metric, previous[metric], result[metric], change))
+    return regressions
+
+
+def format_result(result):
+    return (
+        f"{result['algorithm']:>8} {result['processes']:>9} "
+        f"{result['wall_time']:>9.3f}s {result['peak_memory'] / 2**20:>9.1f} MiB "
+        f"{result['events_per_second']:>12,.0f} events/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scheduling algorithms on generated workloads.")
+    parser.add_argument("--algorithms", nargs="+", default=list(ALGORITHMS), choices=list(ALGORITHMS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", default="benchmark_baseline.json",
+                        help="Baseline file; baselines are only meaningful on the machine that recorded them")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown or memory growth")
+    parser.add_argument("--output", help="Also write the results as JSON to this file")
+    args = parser.parse_args()
+
+    print(f"{'algo':>8} {'processes':>9} {'wall time':>10} {'peak memory':>13} {'throughput':>21}")
+    results = run_benchmarks(args.algorithms, args.sizes, args.repeat, args.seed,
+                             on_result=lambda result: print(format_result(result), flush=True))
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"Baseline written to {args.baseline}.")
+        return 0
+    if not os.path.isfile(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one.")
+        return 0
+
+    regressions = compare(results, load_baseline(args.baseline), args.tolerance)
+    for key, metric, previous, current, change in regressions:
+        print(f"REGRESSION {key} {metric}: {previous:.4g} -> {current:.4g} (+{change:.0%})")
+    if not regressions:
+        print(f"No regressions against {args.baseline}.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
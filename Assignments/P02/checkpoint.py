@@ -0,0 +1,87 @@
+import os
+import pickle
+import tempfile
+import zlib
+
+from process import Process
+from registry import as_workload
+
+MAGIC = b"CPUSIMCK"
+VERSION = 2
+
+
+def write_checkpoint(path, state):
+    """
+    Writes a checkpoint as a zlib-compressed pickle behind a magic/version
+    header. The file is replaced atomically, so an interrupted write leaves
+    the previous checkpoint intact.
+
+    Args:
+        path (str): Checkpoint file.
+        state (dict): Picklable simulator state.
+
+    Returns:
+        int: Size of the checkpoint in bytes.
+    """
+    payload = zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL), 1)
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as checkpoint:
+            checkpoint.write(MAGIC + VERSION.to_bytes(2, "little") + payload)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return len(MAGIC) + 2 + len(payload)
+
+
+def read_checkpoint(path):
+    """
+    Reads a checkpoint written by write_checkpoint.
+
+    Raises:
+        ValueError: If the file is not a checkpoint or has another version.
+    """
+    with open(path, "rb") as checkpoint:
+        data = checkpoint.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"'{path}' is not a simulator checkpoint.")
+    version = int.from_bytes(data[len(MAGIC):len(MAGIC) + 2], "little")
+    if version != VERSION:
+        raise ValueError(f"Checkpoint '{path}' has version {version}, expected {VERSION}.")
+    try:
+        return pickle.loads(zlib.decompress(data[len(MAGIC) + 2:]))
+    except (zlib.error, pickle.UnpicklingError, EOFError) as error:
+        raise ValueError(f"Checkpoint '{path}' is damaged: {error}") from error
+
+
+class TableArrivals:
+    """
+    Resumable arrival stream over an in-memory workload.
+
+    Yields a fresh Process per row in arrival order (ties in workload order,
+    like EventEngine.run), so the workload itself is never modified and only
+    processes in flight are live. position is the number of rows yielded; a
+    stream created with that position continues with the next row.
+
+    Args:
+        workload: ProcessTable or list of processes.
+        position (int): Rows already yielded by an earlier stream.
+    """
+
+    def __init__(self, workload, position=0):
+        self.workload = as_workload(workload)
+        self.order = sorted(range(len(self.workload)), key=self.workload.arrival_time.__getitem__)
+        self.position = position
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.position >= len(self.order):
+            raise StopIteration
+        index = self.order[self.position]
+        self.position += 1
+        table = self.workload
+        return Process(table.pid[index], table.arrival_time[index], table.burst_time[index], table.priority[index])
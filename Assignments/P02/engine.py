@@ -0,0 +1,459 @@
+import heapq
+import random
+from collections import deque
+from operator import attrgetter
+
+# Event kinds. The numeric value doubles as the tie-breaker for events that
+# fire at the same instant: a finishing slice frees the CPU first, arrivals
+# join the ready queue next, and a preempted process re-enters behind them.
+COMPLETION = 0
+ARRIVAL = 1
+QUANTUM_EXPIRY = 2
+DISPATCH = 3
+
+
+class SimulationObserver:
+    """
+    No-op observer for the event engine. Subclass and override the hooks
+    you need (progress bars, logging, timelines).
+    """
+
+    def on_arrival(self, process, time):
+        pass
+
+    def on_dispatch(self, process, time, duration):
+        pass
+
+    def on_preempt(self, process, time, executed):
+        pass
+
+    def on_complete(self, process, time, executed):
+        pass
+
+
+class MultiObserver(SimulationObserver):
+    """
+    Forwards every event to several observers.
+    """
+
+    def __init__(self, *observers):
+        self.observers = observers
+
+    def on_arrival(self, process, time):
+        for observer in self.observers:
+            observer.on_arrival(process, time)
+
+    def on_dispatch(self, process, time, duration):
+        for observer in self.observers:
+            observer.on_dispatch(process, time, duration)
+
+    def on_preempt(self, process, time, executed):
+        for observer in self.observers:
+            observer.on_preempt(process, time, executed)
+
+    def on_complete(self, process, time, executed):
+        for observer in self.observers:
+            observer.on_complete(process, time, executed)
+
+
+class FIFOReadyQueue:
+    """
+    Ready queue served in the order processes became ready (FCFS / Round Robin).
+    """
+
+    def __init__(self):
+        self._queue = deque()
+
+    def push(self, process, time):
+        self._queue.append(process)
+
+    def pop(self, time, core_id=None):
+        return self._queue.popleft()
+
+    def __len__(self):
+        return len(self._queue)
+
+
+class KeyedReadyQueue:
+    """
+    Heap-backed ready queue served in order of key(process) (SJF, Priority).
+    Ties fall back to the order in which processes became ready.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self._heap = []
+        self._order = 0
+
+    def push(self, process, time):
+        heapq.heappush(self._heap, (self.key(process), self._order, process))
+        self._order += 1
+
+    def pop(self, time, core_id=None):
+        return heapq.heappop(self._heap)[2]
+
+    def __len__(self):
+        return len(self._heap)
+
+
+class BucketedReadyQueue:
+    """
+    Multi-level ready queue for small integer key ranges (e.g. priorities 1..5).
+
+    Keeps one FIFO per level plus a bitmap of non-empty levels, so push and pop
+    are constant time: the lowest set bit is the best non-empty level. Within a
+    level processes are served in the order they became ready.
+    """
+
+    def __init__(self, key, min_level, max_level):
+        self.key = key
+        self.min_level = min_level
+        self.buckets = [deque() for _ in range(max_level - min_level + 1)]
+        self.bitmap = 0
+        self._size = 0
+
+    def push(self, process, time):
+        level = self.key(process) - self.min_level
+        self.buckets[level].append(process)
+        self.bitmap |= 1 << level
+        self._size += 1
+
+    def pop(self, time, core_id=None):
+        level = (self.bitmap & -self.bitmap).bit_length() - 1
+        bucket = self.buckets[level]
+        process = bucket.popleft()
+        if not bucket:
+            self.bitmap &= ~(1 << level)
+        self._size -= 1
+        return process
+
+    def __len__(self):
+        return self._size
+
+
+class WorkStealingReadyQueue:
+    """
+    Per-core ready deques with work stealing, served FIFO within each core
+    (FCFS / Round Robin order).
+
+    Arriving processes are placed on one core's deque (round robin, or the core
+    with the least queued work) and a preempted process goes back to the core
+    it ran on. A core takes work from the head of its own deque; when that is
+    empty it steals from the tail of a victim's deque, chosen at random or as
+    the most loaded core. The engine lets free cores with work of their own
+    dispatch first (see has_local_work), so a thief only ever takes work from
+    a busy core, and the slice it runs is time it would otherwise have spent
+    idle, which stolen_work records.
+
+    Args:
+        num_cores (int): Number of cores (one deque each).
+        victim (str): 'random' or 'most_loaded'.
+        placement (str): 'round_robin' or 'least_loaded' for arriving processes.
+        seed (int): Seed for random victim selection.
+        time_quantum (int): Slice length the engine uses, to measure stolen work.
+    """
+
+    def __init__(self, num_cores, victim="random", placement="round_robin", seed=None, time_quantum=None):
+        if victim not in {"random", "most_loaded"}:
+            raise ValueError(f"Unknown victim policy '{victim}'. Choose 'random' or 'most_loaded'.")
+        if placement not in {"round_robin", "least_loaded"}:
+            raise ValueError(f"Unknown placement '{placement}'. Choose 'round_robin' or 'least_loaded'.")
+        self.deques = [deque() for _ in range(num_cores)]
+        self.loads = [0] * num_cores  # Queued remaining time per core
+        self.victim = victim
+        self.placement = placement
+        self.rng = random.Random(seed)
+        self.time_quantum = time_quantum
+        self.steals = 0
+        self.stolen_work = 0
+        self._size = 0
+        self._next_core = 0
+
+    def push(self, process, time):
+        if process.start_time is not None:
+            core_id = process.core_id  # Preempted, keep affinity with its core
+        elif self.placement == "least_loaded":
+            core_id = min(range(len(self.loads)), key=self.loads.__getitem__)
+        else:
+            core_id = self._next_core
+            self._next_core = (self._next_core + 1) % len(self.deques)
+        self.deques[core_id].append(process)
+        self.loads[core_id] += process.remaining_time
+        self._size += 1
+
+    def has_local_work(self, core_id):
+        return bool(self.deques[core_id])
+
+    def pop(self, time, core_id=None):
+        own = self.deques[core_id]
+        if own:
+            process = own.popleft()
+            self.loads[core_id] -= process.remaining_time
+        else:
+            victim = self._choose_victim()
+            process = self.deques[victim].pop()  # Steal from the tail
+            self.loads[victim] -= process.remaining_time
+            self.steals += 1
+            if self.time_quantum:
+                self.stolen_work += min(process.remaining_time, self.time_quantum)
+            else:
+                self.stolen_work += process.remaining_time
+        self._size -= 1
+        return process
+
+    def _choose_victim(self):
+        if self.victim == "most_loaded":
+            return max(range(len(self.loads)), key=self.loads.__getitem__)
+        # Random starting core, then the first non-empty deque after it
+        start = self.rng.randrange(len(self.deques))
+        for offset in range(len(self.deques)):
+            candidate = (start + offset) % len(self.deques)
+            if self.deques[candidate]:
+                return candidate
+
+    def __len__(self):
+        return self._size
+
+
+class KeyThenArrival:
+    """
+    Sort key (key(process), arrival_time). A class rather than a lambda so
+    ready queues using it can be pickled into checkpoints.
+    """
+
+    def __init__(self, key):
+        self.key = key
+
+    def __call__(self, process):
+        return (self.key(process), process.arrival_time)
+
+
+def priority_ready_queue(processes, key=attrgetter("priority"), max_levels=64):
+    """
+    Builds the ready queue for priority scheduling.
+
+    Uses a BucketedReadyQueue when every key is an integer within a range of at
+    most max_levels, and falls back to a heap for arbitrary ranges.
+
+    Args:
+        processes (list): Processes that will be pushed onto the queue.
+        key (function): Priority of a process (lower value = higher priority).
+        max_levels (int): Largest key range served by buckets.
+
+    Returns:
+        Ready queue with push(process, time), pop(time) and __len__.
+    """
+    levels = [key(p) for p in processes]
+    if levels and all(isinstance(level, int) for level in levels):
+        low, high = min(levels), max(levels)
+        if high - low < max_levels:
+            return BucketedReadyQueue(key, low, high)
+    return KeyedReadyQueue(key=KeyThenArrival(key))
+
+
+class EventEngine:
+    """
+    Discrete-event CPU simulator with one global clock.
+
+    Only arrivals, dispatches, quantum expiries and completions are simulated.
+    Future events sit in a heap and the clock jumps straight from one event to
+    the next, so the cost depends on the number of events rather than on the
+    total burst time.
+
+    With num_cores > 1 the cores share the ready queue (SMP): free cores sit in
+    a heap keyed on the time they became available, and each free core pulls
+    the next process from the shared ready queue. Ready queues with per-core
+    work define has_local_work(core_id); free cores with local work are then
+    served before the others.
+
+    Args:
+        ready_queue: Object with push(process, time), pop(time, core_id) and __len__;
+            core_id is the core asking for work.
+        time_quantum (int): Slice length, or None to run each dispatch to completion.
+        observer (SimulationObserver): Optional hooks notified of each event.
+        num_cores (int): Number of cores pulling from the ready queue.
+    """
+
+    def __init__(self, ready_queue, time_quantum=None, observer=None, num_cores=1):
+        self.ready_queue = ready_queue
+        self.time_quantum = time_quantum
+        self.observer = observer or SimulationObserver()
+        self.num_cores = num_cores
+        self.clock = 0
+        self.events = []
+        self.event_count = 0
+        self.completed_count = 0
+        self.free_cores = [(0, core_id) for core_id in range(num_cores)]  # (available since, core_id)
+        self.core_busy_time = [0] * num_cores
+        self._dispatch_pending = False
+        self._seq = 0
+        self._arrivals = iter(())
+        self._last_arrival = None
+
+    def schedule(self, time, kind, process=None, duration=0, core_id=None):
+        """
+        Pushes a future event onto the event heap.
+        """
+        heapq.heappush(self.events, (time, kind, self._seq, process, duration, core_id))
+        self._seq += 1
+
+    def run(self, processes, retain_completed=True, checkpoint_every=None, on_checkpoint=None):
+        """
+        Runs every process to completion and returns them in completion order.
+
+        Arrivals are pulled from processes one at a time, only when the previous
+        arrival fires, so an iterator such as a streamed trace is never held in
+        memory as a whole. Sized collections (lists, ProcessTables) are sorted by
+        arrival first; iterators must already be in arrival order.
+
+        Args:
+            processes: Collection or iterator of processes.
+            retain_completed (bool): Keep completed processes in the returned list.
+                Turn off for open-ended streams and use the observer instead.
+            checkpoint_every (int): Call on_checkpoint(engine) after every this many
+                events, at a point where state() is consistent.
+            on_checkpoint (function): Checkpoint callback, e.g. saving state().
+        """
+        if hasattr(processes, "__len__"):
+            processes = sorted(processes, key=lambda p: p.arrival_time)
+        self._arrivals = iter(processes)
+        self._schedule_next_arrival()
+        return self._run_events(retain_completed, checkpoint_every, on_checkpoint)
+
+    def resume(self, arrivals, retain_completed=True, checkpoint_every=None, on_checkpoint=None):
+        """
+        Continues a run restored with from_state. arrivals must yield the
+        processes that had not been pulled when the state was captured, in
+        arrival order. Takes the same options as run.
+        """
+        self._arrivals = iter(arrivals)
+        return self._run_events(retain_completed, checkpoint_every, on_checkpoint)
+
+    def state(self):
+        """
+        Returns the live state of the run: clock, pending events, ready queue,
+        per-core state and counters. Its size depends on the processes in
+        flight, not on how many have completed. Take it between events (from
+        on_checkpoint); it references live objects, so pickle it right away.
+        """
+        return {
+            "clock": self.clock,
+            "events": self.events,
+            "event_count": self.event_count,
+            "completed_count": self.completed_count,
+            "free_cores": self.free_cores,
+            "core_busy_time": self.core_busy_time,
+            "ready_queue": self.ready_queue,
+            "time_quantum": self.time_quantum,
+            "num_cores": self.num_cores,
+            "dispatch_pending": self._dispatch_pending,
+            "seq": self._seq,
+            "last_arrival": self._last_arrival,
+        }
+
+    @classmethod
+    def from_state(cls, state, observer=None):
+        """
+        Rebuilds an engine from a state() snapshot; continue it with resume().
+        """
+        engine = cls(state["ready_queue"], state["time_quantum"], observer=observer, num_cores=state["num_cores"])
+        engine.clock = state["clock"]
+        engine.events = state["events"]
+        engine.event_count = state["event_count"]
+        engine.completed_count = state["completed_count"]
+        engine.free_cores = state["free_cores"]
+        engine.core_busy_time = state["core_busy_time"]
+        engine._dispatch_pending = state["dispatch_pending"]
+        engine._seq = state["seq"]
+        engine._last_arrival = state["last_arrival"]
+        return engine
+
+    def _run_events(self, retain_completed, checkpoint_every, on_checkpoint):
+        completed = []
+        while self.events:
+            time, kind, _, process, duration, core_id = heapq.heappop(self.events)
+            self.clock = time
+            self.event_count += 1
+
+            if kind == ARRIVAL:
+                self._schedule_next_arrival()
+                self.ready_queue.push(process, time)
+                self.observer.on_arrival(process, time)
+                self._request_dispatch()
+
+            elif kind == DISPATCH:
+                self._dispatch()
+
+            elif kind == QUANTUM_EXPIRY:
+                process.remaining_time -= duration
+                self._release_core(core_id, duration)
+                self.observer.on_preempt(process, time, duration)
+                self.ready_queue.push(process, time)
+                self._request_dispatch()
+
+            elif kind == COMPLETION:
+                process.remaining_time -= duration
+                self._release_core(core_id, duration)
+                process.completion_time = time
+                process.calculate_metrics(time)
+                self.completed_count += 1
+                if retain_completed:
+                    completed.append(process)
+                self.observer.on_complete(process, time, duration)
+                self._request_dispatch()
+
+            if checkpoint_every and self.event_count % checkpoint_every == 0:
+                on_checkpoint(self)
+
+        return completed
+
+    def _schedule_next_arrival(self):
+        process = next(self._arrivals, None)
+        if process is None:
+            return
+        if self._last_arrival is not None and process.arrival_time < self._last_arrival:
+            raise ValueError(f"Process P{process.pid} arrives at {process.arrival_time}, before the previous arrival at {self._last_arrival}; streamed processes must be in arrival order.")
+        self._last_arrival = process.arrival_time
+        self.schedule(process.arrival_time, ARRIVAL, process)
+
+    def _release_core(self, core_id, executed):
+        self.core_busy_time[core_id] += executed
+        heapq.heappush(self.free_cores, (self.clock, core_id))
+
+    def _request_dispatch(self):
+        # Defer the dispatch decision until every event at this instant has fired
+        if not self._dispatch_pending and self.free_cores and self.ready_queue:
+            self._dispatch_pending = True
+            self.schedule(self.clock, DISPATCH)
+
+    def _dispatch(self):
+        # Every free core pulls from the shared ready queue, longest-idle core first
+        self._dispatch_pending = False
+        has_local_work = getattr(self.ready_queue, "has_local_work", None)
+        if has_local_work is not None and len(self.free_cores) > 1:
+            # Cores with work of their own go first, so the rest only steal from busy cores
+            local = sorted(entry for entry in self.free_cores if has_local_work(entry[1]))
+            if local:
+                self.free_cores = [entry for entry in self.free_cores if not has_local_work(entry[1])]
+                heapq.heapify(self.free_cores)
+                for _, core_id in local:
+                    self._start(core_id)
+        while self.free_cores and self.ready_queue:
+            _, core_id = heapq.heappop(self.free_cores)
+            self._start(core_id)
+
+    def _start(self, core_id):
+        process = self.ready_queue.pop(self.clock, core_id)
+        process.core_id = core_id
+        if process.start_time is None:
+            process.start_time = self.clock
+
+        duration = process.remaining_time
+        if self.time_quantum and duration > self.time_quantum:
+            duration = self.time_quantum
+            kind = QUANTUM_EXPIRY
+        else:
+            kind = COMPLETION
+
+        self.observer.on_dispatch(process, self.clock, duration)
+        self.schedule(self.clock + duration, kind, process, duration, core_id)
@@ -1,29 +1,81 @@
+import argparse
+import json
+import os
+import sys
+import time
+
 from simulation import CPUSimulator
 from process import Process
+from registry import SCHEDULERS, get_scheduler
+from result_cache import ScheduleCache
+from batch_logger import BufferedLogger, NullLogger
+
 
-def suggest_time_quantum(processes):
+def choose_algorithm(simulator):
     """
-    Suggests a time quantum based on the average burst time of the processes.
-    Args:
-        processes (list): List of Process objects.
+    Lists the registered algorithms, asks for one and prompts for the
+    parameters it requires (offering a suggested value where there is one).
+    """
+    if not simulator.ready_queue:
+        print("No processes available. Add or randomize processes first.")
+        return
 
-    Returns:
-        int: Suggested time quantum based on average burst time.
+    schedulers = list(SCHEDULERS.values())
+    print("\nAvailable algorithms:")
+    for number, scheduler in enumerate(schedulers, start=1):
+        print(f"  {number}. {scheduler.title}")
+
+    choice = input("Enter your choice (number or name): ").strip().lower()
+    scheduler = next((s for number, s in enumerate(schedulers, start=1) if choice in {str(number), s.name}), None)
+    if scheduler is None:
+        print("Invalid choice. Please select a valid algorithm.")
+        return
+
+    params = {}
+    for parameter in scheduler.parameters:
+        if parameter.required:
+            suggested = parameter.suggest(simulator.ready_queue) if parameter.suggest else None
+            if suggested is not None:
+                print(f"Suggested {parameter.description.title()}: {suggested}.")
+            params[parameter.name] = input(f"Enter {parameter.description} (or press Enter to use suggested): ").strip() or suggested
+    try:
+        simulator.set_algorithm(scheduler.name, **params)
+    except ValueError as error:
+        print(error)
+        return
+
+    settings = ", ".join(
+        f"{parameter.description.title()} = {simulator.algorithm_params[parameter.name]}"
+        for parameter in scheduler.parameters if parameter.required
+    )
+    print(f"Algorithm set to {scheduler.title}{f' with {settings}' if settings else ''}.")
+
+
+def show_cache_stats(cache):
     """
-    if not processes:
-        return 1  # Default to 1 if no processes exist
-    total_burst_time = sum(p.burst_time for p in processes)
-    return max(1, total_burst_time // len(processes))  # Ensure time quantum is at least 1
+    Prints the schedule cache counters.
+    """
+    stats = cache.stats()
+    print(f"Schedule cache: {stats['hits']} hits ({stats['disk_hits']} from disk), {stats['misses']} misses, "
+          f"{stats['entries']} entries using {stats['bytes'] / 2**20:.1f} of {stats['max_bytes'] / 2**20:.0f} MiB, "
+          f"{stats['evictions']} evictions.")
 
 
-def multicore_menu():
+def multicore_menu(cache=None):
     """
     Menu for multicore simulation functionality.
+
+    Args:
+        cache (ScheduleCache): Result cache shared with the single-core shell.
     """
     print("\nWelcome to the Multicore Simulation Shell!")
     print("Type 'help' for a list of multicore commands.")
     num_cores = 2  # Default number of cores
+    strategy = "shared"  # Cores pull from one shared ready queue by default
+    cache = cache or ScheduleCache()
     multicore_simulator = CPUSimulator(num_cores=num_cores)
+    multicore_simulator.record_timeline = True
+    multicore_simulator.cache = cache
 
     while True:
         command = input("Multicore_Sim> ").strip().lower()
@@ -37,12 +89,16 @@ def multicore_menu():
             print("  algo              - Select a scheduling algorithm")
             print("  start             - Start multicore simulation")
             print("  metrics           - Display multicore metrics")
+            print("  timeline          - Export the last run as a timeline file and Gantt chart")
+            print("  cache             - Show schedule cache hits and misses")
             print("  back              - Return to the main menu")
 
         elif command == "setcores":
             try:
                 num_cores = int(input("Enter the number of CPU cores: "))
                 multicore_simulator = CPUSimulator(num_cores=num_cores)
+                multicore_simulator.record_timeline = True
+                multicore_simulator.cache = cache
                 print(f"Number of cores set to {num_cores}.")
             except ValueError:
                 print("Invalid input. Please enter a valid number.")
@@ -68,48 +124,41 @@ def multicore_menu():
                 print("Invalid input. Please enter a valid number.")
 
         elif command == "strategy":
-            strategy = input("Enter load-balancing strategy (round_robin / least_loaded): ").strip().lower()
-            if strategy in {"round_robin", "least_loaded"}:
+            choice = input("Enter load-balancing strategy (shared / work_stealing / round_robin / least_loaded): ").strip().lower()
+            multicore_simulator.work_stealing = None
+            if choice == "shared":
+                strategy = choice
+                print("Cores will pull from a shared ready queue.")
+            elif choice == "work_stealing":
+                strategy = "shared"
+                victim = input("Steal from which core (random / most_loaded): ").strip().lower()
+                multicore_simulator.work_stealing = victim if victim in {"random", "most_loaded"} else "random"
+                print(f"Each core gets its own deque; idle cores steal from a {multicore_simulator.work_stealing.replace('_', ' ')} victim.")
+            elif choice in {"round_robin", "least_loaded"}:
+                strategy = choice
                 multicore_simulator.assign_processes_to_cores(strategy=strategy)
                 print(f"Load-balancing strategy set to {strategy}.")
             else:
-                print("Invalid strategy. Choose 'round_robin' or 'least_loaded'.")
+                print("Invalid strategy. Choose 'shared', 'work_stealing', 'round_robin' or 'least_loaded'.")
 
         elif command == "algo":
-            if not multicore_simulator.ready_queue:
-                print("No processes available. Add or randomize processes first.")
-            else:
-                print("\nAvailable algorithms:")
-                print("  1. FCFS (First-Come, First-Serve)")
-                print("  2. SJF (Shortest Job First)")
-                print("  3. RR (Round Robin)")
-                print("  4. Priority (Non-Preemptive)")
-
-                choice = input("Enter your choice (number or name): ").strip().lower()
-                if choice in {"1", "fcfs"}:
-                    multicore_simulator.set_algorithm("fcfs")
-                    print("Algorithm set to FCFS.")
-                elif choice in {"2", "sjf"}:
-                    multicore_simulator.set_algorithm("sjf")
-                    print("Algorithm set to SJF.")
-                elif choice in {"3", "rr"}:
-                    multicore_simulator.set_algorithm("rr")
-                    suggested_tq = suggest_time_quantum(multicore_simulator.ready_queue)
-                    print(f"Suggested Time Quantum: {suggested_tq} (based on average burst time).")
-                    multicore_simulator.time_quantum = int(input("Enter time quantum (or press Enter to use suggested): ") or suggested_tq)
-                    print(f"Algorithm set to Round Robin with Time Quantum = {multicore_simulator.time_quantum}.")
-                elif choice in {"4", "priority"}:
-                    multicore_simulator.set_algorithm("priority")
-                    print("Algorithm set to Priority Scheduling.")
-                else:
-                    print("Invalid choice. Please select a valid algorithm.")
+            choose_algorithm(multicore_simulator)
 
         elif command == "start":
-            multicore_simulator.simulate()
+            if strategy == "shared":
+                multicore_simulator.simulate()
+            else:
+                multicore_simulator.simulate_partitioned(strategy=strategy)
 
         elif command == "metrics":
             multicore_simulator.analyze_metrics()
 
+        elif command == "timeline":
+            export_timeline(multicore_simulator)
+
+        elif command == "cache":
+            show_cache_stats(cache)
+
         elif command == "back":
             print("Returning to the main menu.")
             break
@@ -118,11 +167,26 @@ def multicore_menu():
             print("Unknown command. Type 'help' for a list of multicore commands.")
 
 
+def export_timeline(simulator):
+    """
+    Prompts for output paths and exports the timeline of the last simulation.
+    """
+    path = input("Enter timeline file (or press Enter for timeline.npz): ").strip() or "timeline.npz"
+    chart_path = input("Enter Gantt chart image (or press Enter for timeline.png, '-' to skip): ").strip() or "timeline.png"
+    try:
+        simulator.export_timeline(path, None if chart_path == "-" else chart_path)
+    except (ValueError, OSError) as error:
+        print(error)
+
+
 def main():
     """
     Main menu for single-core and multicore simulation.
     """
+    cache = ScheduleCache()  # Repeated identical runs are loaded instead of simulated
     simulator = CPUSimulator()
+    simulator.record_timeline = True
+    simulator.cache = cache
     print("Welcome to the CPU Scheduling Simulator Shell!")
     print("Type 'help' for a list of commands.")
 
@@ -133,9 +197,13 @@ def main():
             print("\nCommands:")
             print("  add               - Add a new process manually (single-core)")
             print("  randomize         - Add a random process (single-core)")
+            print("  generate          - Generate a seeded synthetic workload (single-core)")
+            print("  trace             - Stream processes from a CSV/JSONL trace (single-core)")
             print("  algo              - Select a scheduling algorithm (single-core)")
             print("  start             - Start the simulation (single-core)")
             print("  metrics           - Display performance metrics (single-core)")
+            print("  timeline          - Export the last run as a timeline file and Gantt chart")
+            print("  cache             - Show schedule cache hits and misses")
             print("  multicore         - Switch to multicore simulation menu")
             print("  exit              - Exit the simulator")
 
@@ -159,43 +227,41 @@ def main():
             except ValueError:
                 print("Invalid input. Please enter a valid number.")
 
+        elif command == "generate":
+            try:
+                num_processes = int(input("Enter number of processes to generate: "))
+                seed = input("Enter seed (or press Enter for a random one): ").strip()
+                simulator.generate_processes(num_processes, seed=int(seed) if seed else None)
+            except ValueError:
+                print("Invalid input. Please enter valid numbers.")
+
+        elif command == "trace":
+            path = input("Enter trace file path (.csv or .jsonl): ").strip()
+            try:
+                simulator.load_trace(path)
+            except (ValueError, OSError) as error:
+                print(error)
+
         elif command == "algo":
-            if not simulator.ready_queue:
-                print("No processes available. Add or randomize processes first.")
-            else:
-                print("\nAvailable algorithms:")
-                print("  1. FCFS (First-Come, First-Serve)")
-                print("  2. SJF (Shortest Job First)")
-                print("  3. RR (Round Robin)")
-                print("  4. Priority (Non-Preemptive)")
-
-                choice = input("Enter your choice (number or name): ").strip().lower()
-                if choice in {"1", "fcfs"}:
-                    simulator.set_algorithm("fcfs")
-                    print("Algorithm set to FCFS.")
-                elif choice in {"2", "sjf"}:
-                    simulator.set_algorithm("sjf")
-                    print("Algorithm set to SJF.")
-                elif choice in {"3", "rr"}:
-                    simulator.set_algorithm("rr")
-                    suggested_tq = suggest_time_quantum(simulator.ready_queue)
-                    print(f"Suggested Time Quantum: {suggested_tq} (based on average burst time).")
-                    simulator.time_quantum = int(input("Enter time quantum (or press Enter to use suggested): ") or suggested_tq)
-                    print(f"Algorithm set to Round Robin with Time Quantum = {simulator.time_quantum}.")
-                elif choice in {"4", "priority"}:
-                    simulator.set_algorithm("priority")
-                    print("Algorithm set to Priority Scheduling.")
-                else:
-                    print("Invalid choice. Please select a valid algorithm.")
+            choose_algorithm(simulator)
 
         elif command == "start":
-            simulator.simulate()
+            try:
+                simulator.simulate()
+            except (ValueError, OSError) as error:
+                print(error)
 
         elif command == "metrics":
             simulator.display_metrics()
 
+        elif command == "timeline":
+            export_timeline(simulator)
+
+        elif command == "cache":
+            show_cache_stats(cache)
+
         elif command == "multicore":
-            multicore_menu()
+            multicore_menu(cache)
 
         elif command == "exit":
             print("Exiting simulation. Goodbye!")
@@ -205,5 +271,200 @@ def main():
             print("Unknown command. Type 'help' for a list of commands.")
 
 
+def build_parser():
+    """
+    Command-line options for headless batch runs. Every option can also be
+    given in a JSON config file (keys are the option names, with dashes or
+    underscores); options on the command line override the file.
+    """
+    parser = argparse.ArgumentParser(
+        description="CPU scheduling simulator. Without arguments it starts the interactive shell; "
+                    "with arguments it runs one simulation headless and writes the metrics as JSON.",
+    )
+    parser.add_argument("--config", help="JSON file with any of the options below")
+
+    workload = parser.add_argument_group("workload (choose one)")
+    workload.add_argument("--trace", help="Stream processes from a CSV/JSONL trace sorted by arrival time")
+    workload.add_argument("--generate", type=int, metavar="N", help="Generate N synthetic processes")
+    workload.add_argument("--seed", type=int, help="Seed for --generate and for random steal victims")
+    workload.add_argument("--arrival", default="poisson", choices=["poisson", "uniform"])
+    workload.add_argument("--arrival-rate", type=float, default=0.5)
+    workload.add_argument("--burst", default="pareto", choices=["pareto", "lognormal", "uniform"])
+    workload.add_argument("--max-burst", type=int)
+
+    scheduling = parser.add_argument_group("scheduling")
+    scheduling.add_argument("--algorithm", default="fcfs", choices=list(SCHEDULERS))
+    scheduling.add_argument("--param", action="append", default=[], metavar="NAME=VALUE",
+                            help="Algorithm parameter, e.g. --param time_quantum=4 (repeatable)")
+    scheduling.add_argument("--time-quantum", type=int, help="Shorthand for --param time_quantum=N")
+    scheduling.add_argument("--cores", type=int, default=1)
+    scheduling.add_argument("--strategy", default="shared",
+                            choices=["shared", "work_stealing", "round_robin", "least_loaded"])
+    scheduling.add_argument("--victim", default="most_loaded", choices=["random", "most_loaded"],
+                            help="Steal victim for --strategy work_stealing")
+    scheduling.add_argument("--longest-first", action="store_true", help="LPT order for --strategy least_loaded")
+    scheduling.add_argument("--executor", choices=["thread", "process"], help="Pool for partitioned strategies")
+
+    output = parser.add_argument_group("output")
+    output.add_argument("--output", default="-", help="Metrics JSON file, or - for stdout")
+    output.add_argument("--log", help="Per-process log file (written in batches)")
+    output.add_argument("--log-format", default="jsonl", choices=["jsonl", "csv"])
+    output.add_argument("--timeline", help="Write the run's timeline to this .npz file")
+    output.add_argument("--cache-dir", help="On-disk schedule cache shared between runs")
+
+    checkpointing = parser.add_argument_group("checkpointing")
+    checkpointing.add_argument("--checkpoint", help="Save the simulator state to this file periodically")
+    checkpointing.add_argument("--checkpoint-every", type=int, default=100000, metavar="EVENTS")
+    checkpointing.add_argument("--resume", action="store_true",
+                               help="Continue from --checkpoint if it exists (otherwise start over)")
+    return parser
+
+
+def parse_batch_args(argv):
+    """
+    Parses batch options, reading defaults from --config when one is given.
+    Invalid options, including algorithm parameters and core counts, exit
+    with status 2 through parser.error.
+    """
+    parser = build_parser()
+    args, _ = parser.parse_known_args(argv)
+    if args.config:
+        try:
+            with open(args.config) as config_file:
+                config = json.load(config_file)
+        except (OSError, ValueError) as error:
+            parser.error(f"Cannot read config file {args.config}: {error}")
+        if not isinstance(config, dict):
+            parser.error(f"Config file {args.config} must contain a JSON object.")
+        config = {key.replace("-", "_"): value for key, value in config.items()}
+        if isinstance(config.get("param"), dict):
+            # "param": {"time_quantum": 4} is the same as --param time_quantum=4
+            config["param"] = [f"{name}={value}" for name, value in config["param"].items()]
+        actions = {action.dest: action for action in parser._actions}
+        unknown = set(config) - set(actions)
+        if unknown:
+            parser.error(f"Unknown option(s) in {args.config}: {', '.join(sorted(unknown))}")
+        for key, value in config.items():
+            # argparse only checks choices for values given on the command line
+            if actions[key].choices is not None and value not in actions[key].choices:
+                parser.error(f"Invalid {key} '{value}' in {args.config}; choose from {', '.join(map(str, actions[key].choices))}.")
+        parser.set_defaults(**config)
+    args = parser.parse_args(argv)
+    if (args.trace is None) == (args.generate is None):
+        parser.error("Give exactly one workload: --trace PATH or --generate N.")
+    if args.cores < 1:
+        parser.error(f"--cores must be at least 1, got {args.cores}.")
+    if args.checkpoint_every < 1:
+        parser.error(f"--checkpoint-every must be at least 1, got {args.checkpoint_every}.")
+    try:
+        get_scheduler(args.algorithm).validate(algorithm_params(args))
+    except ValueError as error:
+        parser.error(str(error))
+    if args.timeline and args.trace:
+        parser.error("--timeline needs --generate; streamed traces are not recorded.")
+    if args.resume and not args.checkpoint:
+        parser.error("--resume needs --checkpoint.")
+    if args.checkpoint and args.cores > 1 and args.strategy in ("round_robin", "least_loaded"):
+        parser.error("Checkpointing needs --strategy shared or work_stealing.")
+    return args
+
+
+def algorithm_params(args):
+    """
+    Collects algorithm parameters from --param NAME=VALUE and --time-quantum.
+    Values are converted by the registry when the algorithm is set.
+    """
+    params = {}
+    for item in args.param:
+        name, separator, value = str(item).partition("=")
+        if not separator:
+            raise ValueError(f"Invalid --param '{item}', expected NAME=VALUE.")
+        params[name.strip()] = value.strip()
+    if args.time_quantum is not None:
+        params["time_quantum"] = args.time_quantum
+    return params
+
+
+def run_batch(argv):
+    """
+    Runs one simulation headless (no prompts, progress bars or console output)
+    and writes its configuration and metrics as one JSON object. The reported
+    strategy is the one the run used, e.g. round_robin partitioning when the
+    algorithm has no shared-queue version. Per-process records are only
+    written with --log.
+
+    Returns:
+        int: Exit code; 0 on success, 1 if the simulation failed or produced no
+        metrics (the JSON then has "status": "error"), 2 for invalid options.
+    """
+    args = parse_batch_args(argv)
+    report = {
+        "algorithm": args.algorithm,
+        "cores": args.cores,
+        "strategy": args.strategy if args.cores > 1 else None,
+        "workload": args.trace or {"generate": args.generate, "seed": args.seed},
+    }
+    resume = args.resume and os.path.exists(args.checkpoint)
+    report["resumed"] = resume
+    logger = BufferedLogger(args.log, format=args.log_format, append=resume) if args.log else NullLogger()
+    start = time.perf_counter()
+    try:
+        simulator = CPUSimulator(num_cores=args.cores, logger=logger)
+        simulator.console.quiet = True
+        simulator.record_timeline = bool(args.timeline)
+        if args.cache_dir:
+            simulator.cache = ScheduleCache(directory=args.cache_dir)
+        simulator.set_algorithm(args.algorithm, **algorithm_params(args))
+        report["params"] = simulator.algorithm_params
+
+        if args.trace:
+            simulator.load_trace(args.trace)
+        else:
+            simulator.generate_processes(
+                args.generate, seed=args.seed, arrival=args.arrival, arrival_rate=args.arrival_rate,
+                burst=args.burst, max_burst=args.max_burst,
+            )
+
+        if args.cores > 1 and args.strategy == "work_stealing":
+            simulator.work_stealing = args.victim
+            simulator.work_stealing_seed = args.seed
+        if args.checkpoint:
+            simulator.simulate_checkpointed(args.checkpoint, args.checkpoint_every, resume=resume)
+        elif args.cores > 1 and args.strategy in ("round_robin", "least_loaded"):
+            simulator.simulate_partitioned(strategy=args.strategy, executor=args.executor, longest_first=args.longest_first)
+        else:
+            simulator.simulate(show_progress=False)
+
+        metrics = simulator.analyze_metrics()
+        if metrics is None:
+            raise ValueError("The simulation produced no metrics.")
+        if args.cores > 1:
+            report["strategy"] = simulator.strategy  # e.g. MLFQ falls back from shared to round_robin
+        if args.timeline:
+            simulator.export_timeline(args.timeline)
+        if logger:
+            logger.close()
+        report.update(status="ok", metrics=metrics)
+    except (ValueError, OSError) as error:
+        report.update(status="error", error=str(error))
+    finally:
+        if logger:
+            logger.close()
+    report["wall_time"] = time.perf_counter() - start
+
+    text = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+    if report["status"] != "ok":
+        print(f"Simulation failed: {report['error']}", file=sys.stderr)
+        return 1
+    return 0
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_batch(sys.argv[1:]))
     main()
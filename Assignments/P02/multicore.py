@@ -1,11 +1,21 @@
-def assign_processes_to_cores(processes, num_cores, strategy="least_loaded"):
+import heapq
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from process_table import ProcessTable
+
+def assign_processes_to_cores(processes, num_cores, strategy="least_loaded", longest_first=False):
     """
     Distributes processes across multiple CPU cores based on the chosen strategy.
 
+    least_loaded keeps a min-heap of (accumulated burst time, core_id), so each
+    assignment is O(log k) instead of re-summing every core's queue.
+
     Args:
         processes (list): List of Process objects.
         num_cores (int): Number of CPU cores.
         strategy (str): Load balancing strategy ('round_robin' or 'least_loaded').
+        longest_first (bool): For least_loaded, assign in longest-processing-time-first
+            order (LPT) instead of input order.
 
     Returns:
         list: A list of queues (one per core) containing assigned processes.
@@ -21,32 +31,98 @@ def assign_processes_to_cores(processes, num_cores, strategy="least_loaded"):
 
     elif strategy == "least_loaded":
         # Assign each process to the core with the smallest total burst time
+        if longest_first:
+            processes = sorted(processes, key=lambda p: p.burst_time, reverse=True)
+        core_loads = [(0, core_id) for core_id in range(num_cores)]
         for process in processes:
-            least_loaded_core = min(core_queues, key=lambda queue: sum(p.burst_time for p in queue))
-            core_id = core_queues.index(least_loaded_core)
+            load, core_id = core_loads[0]
             process.core_id = core_id
             core_queues[core_id].append(process)
+            heapq.heapreplace(core_loads, (load + process.burst_time, core_id))
 
     return core_queues
 
-def simulate_multicore_execution(core_queues, scheduling_algorithm):
+def run_core_schedule(scheduling_algorithm, core_id, queue):
+    """
+    Runs the scheduling algorithm on one core's queue and tags the results with core_id.
+    Module-level so it can be sent to a process pool.
+    """
+    core_scheduled = scheduling_algorithm(queue)
+    for process in core_scheduled:
+        process.core_id = core_id  # Ensure core_id is preserved
+    return core_scheduled
+
+def run_core_table(scheduling_algorithm, core_id, table):
+    """
+    Process-pool worker: schedules a core's ProcessTable and returns the table
+    with the completion order as row indices, which pickle far more compactly
+    than a list of process objects.
+    """
+    core_scheduled = run_core_schedule(scheduling_algorithm, core_id, table)
+    return table, [process.index for process in core_scheduled]
+
+def simulate_multicore_execution(core_queues, scheduling_algorithm, executor=None, max_workers=None, verbose=True):
     """
     Simulates execution of processes on multiple CPU cores.
 
+    Per-core schedules are independent, so they can run in parallel on a
+    process or thread pool. For a process pool each queue is shipped to its
+    worker as a ProcessTable and the results are copied back onto the original
+    process objects, so every mode returns the same objects with the same
+    fields. scheduling_algorithm must then be picklable (a module-level
+    function or a functools.partial of one).
+
     Args:
         core_queues (list): List of queues (one per core) with assigned processes.
         scheduling_algorithm (function): Scheduling algorithm to run on each core.
+        executor (str): None to run cores one after another, or 'process' / 'thread'
+            to run them on a pool of that type.
+        max_workers (int): Pool size; defaults to the executor's own default.
+        verbose (bool): Print which core or pool is being simulated.
 
     Returns:
-        list: List of scheduled processes for all cores.
+        list: List of scheduled processes for all cores, in core order.
     """
     scheduled_processes = []
-    for core_id, queue in enumerate(core_queues):
-        print(f"\nSimulating Core {core_id}...")
-        # Run the scheduling algorithm on each core's queue
-        core_scheduled = scheduling_algorithm(queue)
-        for process in core_scheduled:
-            process.core_id = core_id  # Ensure core_id is preserved
-        scheduled_processes.extend(core_scheduled)
+    if executor is None:
+        for core_id, queue in enumerate(core_queues):
+            if verbose:
+                print(f"\nSimulating Core {core_id}...")
+            # Run the scheduling algorithm on each core's queue
+            scheduled_processes.extend(run_core_schedule(scheduling_algorithm, core_id, queue))
+        return scheduled_processes
+
+    if verbose:
+        print(f"\nSimulating {len(core_queues)} cores on a {executor} pool...")
+    if executor == "thread":
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(run_core_schedule, scheduling_algorithm, core_id, queue)
+                for core_id, queue in enumerate(core_queues)
+            ]
+            # Merge results in core order
+            for future in futures:
+                scheduled_processes.extend(future.result())
+        return scheduled_processes
+
+    if executor != "process":
+        raise ValueError(f"Unknown executor '{executor}'. Choose 'process' or 'thread'.")
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(run_core_table, scheduling_algorithm, core_id, ProcessTable.from_processes(queue))
+            for core_id, queue in enumerate(core_queues)
+        ]
+        # Merge results in core order, copying them back onto the original processes
+        for queue, future in zip(core_queues, futures):
+            table, order = future.result()
+            for index in order:
+                process = queue[index]
+                process.remaining_time = table.remaining_time[index]
+                process.start_time = table.start_time[index]
+                process.core_id = table.core_id[index]
+                process.completion_time = table.completion_time[index]
+                process.calculate_metrics(process.completion_time)
+                scheduled_processes.append(process)
 
     return scheduled_processes
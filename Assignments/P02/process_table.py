@@ -0,0 +1,244 @@
+from array import array
+
+UNSET = -1  # Sentinel for start/completion times and core ids that are not set yet
+
+
+def _int_array(values):
+    """
+    Builds an int64 array, copying NumPy buffers directly instead of element by element.
+    """
+    column = array("q")
+    if hasattr(values, "astype"):
+        column.frombytes(values.astype("int64").tobytes())
+    else:
+        column.extend(values)
+    return column
+
+
+class ProcessView:
+    """
+    Lightweight per-process view of one row in a ProcessTable.
+
+    Exposes the same attributes as Process (arrival_time, burst_time,
+    remaining_time, start_time, completion_time, ...) so the schedulers can use
+    it unchanged, while the data itself stays in the table's typed arrays.
+    """
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    @property
+    def pid(self):
+        return self.table.pid[self.index]
+
+    @property
+    def arrival_time(self):
+        return self.table.arrival_time[self.index]
+
+    @property
+    def burst_time(self):
+        return self.table.burst_time[self.index]
+
+    @property
+    def priority(self):
+        return self.table.priority[self.index]
+
+    @property
+    def remaining_time(self):
+        return self.table.remaining_time[self.index]
+
+    @remaining_time.setter
+    def remaining_time(self, value):
+        self.table.remaining_time[self.index] = value
+
+    @property
+    def start_time(self):
+        value = self.table.start_time[self.index]
+        return None if value == UNSET else value
+
+    @start_time.setter
+    def start_time(self, value):
+        self.table.start_time[self.index] = UNSET if value is None else value
+
+    @property
+    def completion_time(self):
+        value = self.table.completion_time[self.index]
+        return None if value == UNSET else value
+
+    @completion_time.setter
+    def completion_time(self, value):
+        self.table.completion_time[self.index] = UNSET if value is None else value
+
+    @property
+    def core_id(self):
+        value = self.table.core_id[self.index]
+        return None if value == UNSET else value
+
+    @core_id.setter
+    def core_id(self, value):
+        self.table.core_id[self.index] = UNSET if value is None else value
+
+    @property
+    def turnaround_time(self):
+        completion_time = self.completion_time
+        return None if completion_time is None else completion_time - self.arrival_time
+
+    @property
+    def waiting_time(self):
+        turnaround_time = self.turnaround_time
+        return None if turnaround_time is None else turnaround_time - self.burst_time
+
+    def calculate_metrics(self, current_time):
+        """
+        Records the completion time; waiting and turnaround times are derived from it.
+        """
+        self.completion_time = current_time
+
+    def __eq__(self, other):
+        return isinstance(other, ProcessView) and self.table is other.table and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.table), self.index))
+
+    def __repr__(self):
+        return f"ProcessView(pid={self.pid}, arrival_time={self.arrival_time}, burst_time={self.burst_time}, priority={self.priority})"
+
+
+class ProcessTable:
+    """
+    Structure-of-arrays process store.
+
+    Each attribute lives in its own typed array (about 60 bytes per process
+    instead of a full Python object), which keeps large workloads compact and
+    cache friendly. The table behaves like a list of processes: iterating or
+    indexing it yields ProcessView objects, so it can be passed directly to the
+    scheduling algorithms and to CPUSimulator. Times are integer time units.
+    """
+
+    def __init__(self):
+        self.pid = array("q")
+        self.arrival_time = array("q")
+        self.burst_time = array("q")
+        self.priority = array("q")
+        self.remaining_time = array("q")
+        self.start_time = array("q")
+        self.completion_time = array("q")
+        self.core_id = array("i")
+
+    @classmethod
+    def from_processes(cls, processes):
+        """
+        Builds a table from Process objects (or anything with the same attributes).
+        """
+        table = cls()
+        for process in processes:
+            table.append(process)
+        return table
+
+    @classmethod
+    def from_arrays(cls, arrival_times, burst_times, priorities, pids=None):
+        """
+        Builds a table from parallel sequences (lists, arrays or NumPy arrays).
+
+        Args:
+            arrival_times: Arrival time of each process.
+            burst_times: Burst time of each process.
+            priorities: Priority of each process (lower is higher priority).
+            pids: Process IDs; defaults to 1..n.
+
+        Returns:
+            ProcessTable: Table with every process unstarted.
+        """
+        table = cls()
+        count = len(arrival_times)
+        table.pid = _int_array(pids if pids is not None else range(1, count + 1))
+        table.arrival_time = _int_array(arrival_times)
+        table.burst_time = _int_array(burst_times)
+        table.priority = _int_array(priorities)
+        table.remaining_time = array("q", table.burst_time)
+        table.start_time = array("q", [UNSET]) * count
+        table.completion_time = array("q", [UNSET]) * count
+        table.core_id = array("i", [UNSET]) * count
+        return table
+
+    def copy(self):
+        """
+        Returns a new table with the same workload and every process unstarted.
+        """
+        return ProcessTable.from_arrays(self.arrival_time, self.burst_time, self.priority, pids=self.pid)
+
+    def extend(self, other):
+        """
+        Appends every process of another ProcessTable, keeping its run-time state.
+        """
+        for name, column in self.columns().items():
+            column.extend(other.columns()[name])
+
+    def append(self, process):
+        """
+        Copies a process into the table and returns its view.
+        """
+        self.pid.append(process.pid)
+        self.arrival_time.append(process.arrival_time)
+        self.burst_time.append(process.burst_time)
+        self.priority.append(process.priority)
+        self.remaining_time.append(process.remaining_time)
+        self.start_time.append(UNSET if process.start_time is None else process.start_time)
+        self.completion_time.append(UNSET if process.completion_time is None else process.completion_time)
+        self.core_id.append(UNSET if getattr(process, "core_id", None) is None else process.core_id)
+        return ProcessView(self, len(self.pid) - 1)
+
+    def reset(self):
+        """
+        Clears every run-time field so the workload can be simulated again.
+        """
+        count = len(self)
+        self.remaining_time = array("q", self.burst_time)
+        self.start_time = array("q", [UNSET]) * count
+        self.completion_time = array("q", [UNSET]) * count
+        self.core_id = array("i", [UNSET]) * count
+
+    def as_numpy(self):
+        """
+        Returns zero-copy NumPy views of the columns, for the vectorized metrics.
+        The table cannot grow while these views are alive.
+        """
+        import numpy as np
+        return {
+            name: np.frombuffer(column, dtype=np.int64 if column.typecode == "q" else np.int32)
+            for name, column in self.columns().items()
+        }
+
+    def columns(self):
+        """
+        Returns the typed arrays keyed by attribute name.
+        """
+        return {
+            "pid": self.pid,
+            "arrival_time": self.arrival_time,
+            "burst_time": self.burst_time,
+            "priority": self.priority,
+            "remaining_time": self.remaining_time,
+            "start_time": self.start_time,
+            "completion_time": self.completion_time,
+            "core_id": self.core_id,
+        }
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ProcessView(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("process table index out of range")
+        return ProcessView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.pid)):
+            yield ProcessView(self, index)
@@ -0,0 +1,260 @@
+from array import array
+from functools import partial
+from operator import attrgetter
+
+from engine import FIFOReadyQueue, KeyedReadyQueue, priority_ready_queue
+from process_table import ProcessTable, ProcessView, UNSET
+from scheduler import fcfs, sjf_non_preemptive, round_robin, priority_non_preemptive, mlfq, srtf, priority_preemptive
+
+
+class Parameter:
+    """
+    One parameter a scheduler declares.
+
+    Args:
+        name (str): Keyword argument of the scheduling function.
+        type (type): Values are converted to this type.
+        default: Value used when none is given; None makes the parameter required.
+        description (str): Human-readable description, used for prompts.
+        minimum: Smallest allowed value, or None.
+        suggest (function): Optional suggest(workload) giving a sensible value.
+    """
+
+    def __init__(self, name, type=int, default=None, description="", minimum=None, suggest=None):
+        self.name = name
+        self.type = type
+        self.default = default
+        self.description = description or name.replace("_", " ")
+        self.minimum = minimum
+        self.suggest = suggest
+
+    @property
+    def required(self):
+        return self.default is None
+
+    def convert(self, value):
+        try:
+            value = self.type(value)
+        except (TypeError, ValueError) as error:
+            raise ValueError(f"Invalid {self.description} {value!r}: {error}") from error
+        if self.minimum is not None and value < self.minimum:
+            raise ValueError(f"The {self.description} must be at least {self.minimum}, got {value}.")
+        return value
+
+
+class ScheduleResult:
+    """
+    Run-time state of one schedule over a workload that is never modified.
+
+    pid, arrival_time, burst_time and priority are the workload's own typed
+    arrays, shared rather than copied; remaining_time, start_time,
+    completion_time and core_id are arrays owned by the result. The result
+    therefore looks like a ProcessTable to ProcessView, and the schedulers run
+    on its views unchanged. One workload can back any number of results, in
+    any number of threads, and a process pool only needs it pickled once.
+
+    Iterating the result yields the completed processes in completion order.
+    """
+
+    def __init__(self, workload):
+        count = len(workload)
+        self.workload = workload
+        self.pid = workload.pid
+        self.arrival_time = workload.arrival_time
+        self.burst_time = workload.burst_time
+        self.priority = workload.priority
+        self.remaining_time = array("q", workload.burst_time)
+        self.start_time = array("q", [UNSET]) * count
+        self.completion_time = array("q", [UNSET]) * count
+        self.core_id = array("i", [UNSET]) * count
+        self.order = array("q")  # Row indices in completion order
+
+    def processes(self):
+        """
+        Returns a view of every process, in workload order, to hand to a scheduler.
+        """
+        return [ProcessView(self, index) for index in range(len(self.pid))]
+
+    def record(self, completed):
+        """
+        Stores the completion order returned by a scheduler (views of this result).
+        """
+        self.order = array("q", [process.index for process in completed])
+        return self
+
+    @property
+    def completed(self):
+        """
+        Completed processes in completion order.
+        """
+        return [ProcessView(self, index) for index in self.order]
+
+    def __len__(self):
+        return len(self.order)
+
+    def __iter__(self):
+        for index in self.order:
+            yield ProcessView(self, index)
+
+
+class Scheduler:
+    """
+    A registered scheduling algorithm and the parameters it accepts.
+
+    Args:
+        name (str): Registry key, e.g. 'rr'.
+        function (function): Scheduling function taking a process list and the parameters.
+        title (str): Human-readable name for menus.
+        parameters (sequence): Parameter objects, in prompt order.
+        ready_queue (function): Optional ready_queue(processes, params) returning the
+            event-engine ready queue and time quantum for this algorithm.
+        fifo (bool): Processes are served in the order they became ready, so the
+            algorithm can run on per-core work-stealing deques.
+        progress (bool): The function accepts an on_progress(process, executed)
+            callback run after each slice, so direct runs can draw progress.
+    """
+
+    def __init__(self, name, function, title, parameters=(), ready_queue=None, fifo=False, progress=False):
+        self.name = name
+        self.function = function
+        self.title = title
+        self.parameters = tuple(parameters)
+        self.ready_queue = ready_queue
+        self.fifo = fifo
+        self.progress = progress
+
+    def validate(self, params):
+        """
+        Checks and converts parameter values and fills in defaults.
+
+        Returns:
+            dict: One value per declared parameter.
+        """
+        declared = {parameter.name: parameter for parameter in self.parameters}
+        unknown = set(params) - set(declared)
+        if unknown:
+            raise ValueError(f"{self.title} does not take {', '.join(sorted(unknown))}.")
+        values = {}
+        for name, parameter in declared.items():
+            value = params.get(name)
+            if value is None:
+                if parameter.required:
+                    raise ValueError(f"{self.title} needs a {parameter.description}.")
+                value = parameter.default
+            values[name] = parameter.convert(value)
+        return values
+
+    def bind(self, **params):
+        """
+        Returns the scheduling function with its parameters bound. It schedules
+        (and updates) whatever processes it is given; picklable for process pools.
+        """
+        return partial(self.function, **self.validate(params))
+
+    def run(self, workload, on_progress=None, **params):
+        """
+        Schedules a workload without modifying it.
+
+        Args:
+            workload: ProcessTable, or a list of processes (copied into a table once).
+            on_progress (function): Optional callback(process, executed) run after each
+                slice; ignored unless the scheduler declares progress.
+            **params: Values for the declared parameters.
+
+        Returns:
+            ScheduleResult: Start, completion and core of every process, and the completion order.
+        """
+        function = self.bind(**params)
+        if on_progress is not None and self.progress:
+            function = partial(function, on_progress=on_progress)
+        result = ScheduleResult(as_workload(workload))
+        return result.record(function(result.processes()))
+
+    def event_queue(self, processes, **params):
+        """
+        Returns the event-engine ready queue and time quantum for this algorithm,
+        or (None, None) if it has no event-driven equivalent.
+        """
+        if self.ready_queue is None:
+            return None, None
+        return self.ready_queue(processes, self.validate(params))
+
+    def __repr__(self):
+        return f"Scheduler({self.name!r})"
+
+
+SCHEDULERS = {}  # name -> Scheduler, in registration (menu) order
+
+
+def register(name, function, title, parameters=(), ready_queue=None, fifo=False, progress=False):
+    """
+    Adds a scheduling algorithm to the registry and returns its Scheduler.
+    """
+    if name in SCHEDULERS:
+        raise ValueError(f"Scheduler '{name}' is already registered.")
+    SCHEDULERS[name] = Scheduler(name, function, title, parameters, ready_queue, fifo, progress)
+    return SCHEDULERS[name]
+
+
+def get_scheduler(name):
+    """
+    Looks up a registered scheduler by name.
+    """
+    try:
+        return SCHEDULERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown algorithm '{name}'. Choose one of: {', '.join(SCHEDULERS)}.") from None
+
+
+def run_scheduler(name, workload, **params):
+    """
+    Schedules a workload with a registered algorithm without modifying it (see Scheduler.run).
+    """
+    return get_scheduler(name).run(workload, **params)
+
+
+def as_workload(processes):
+    """
+    Returns processes as a ProcessTable, copying only if it is not one already.
+    """
+    return processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(processes)
+
+
+def suggest_time_quantum(processes):
+    """
+    Suggests a time quantum based on the average burst time of the processes.
+    Args:
+        processes (list): List of Process objects.
+
+    Returns:
+        int: Suggested time quantum based on average burst time.
+    """
+    if not processes or not hasattr(processes, "__len__"):
+        return 1  # Default to 1 if no processes exist (or they are streamed from a trace)
+    total_burst_time = sum(p.burst_time for p in processes)
+    return max(1, total_burst_time // len(processes))  # Ensure time quantum is at least 1
+
+
+def _priority_queue(processes, params):
+    if not hasattr(processes, "__len__"):
+        # Priority range is unknown without reading the whole trace
+        return KeyedReadyQueue(key=attrgetter("priority", "arrival_time")), None
+    return priority_ready_queue(processes), None
+
+
+register("fcfs", fcfs, "FCFS (First-Come, First-Serve)",
+         ready_queue=lambda processes, params: (FIFOReadyQueue(), None), fifo=True)
+register("sjf", sjf_non_preemptive, "SJF (Shortest Job First)",
+         ready_queue=lambda processes, params: (KeyedReadyQueue(key=attrgetter("burst_time", "arrival_time")), None))
+register("rr", round_robin, "RR (Round Robin)",
+         [Parameter("time_quantum", int, description="time quantum", minimum=1, suggest=suggest_time_quantum)],
+         ready_queue=lambda processes, params: (FIFOReadyQueue(), params["time_quantum"]), fifo=True, progress=True)
+register("priority", priority_non_preemptive, "Priority (Non-Preemptive)", ready_queue=_priority_queue)
+register("mlfq", mlfq, "MLFQ (Multi-Level Feedback Queue)", [
+    Parameter("num_queues", int, 3, "number of queues", minimum=1),
+    Parameter("base_time_quantum", int, 4, "base time quantum", minimum=1),
+    Parameter("boost_interval", int, 50, "priority boost interval (0 disables boosting)", minimum=0),
+], progress=True)
+register("srtf", srtf, "SRTF (Shortest Remaining Time First)")
+register("priority_preemptive", priority_preemptive, "Priority (Preemptive, with aging)",
+         [Parameter("aging_interval", int, 10, "aging interval", minimum=1)])
@@ -0,0 +1,128 @@
+import threading
+
+from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
+
+from engine import SimulationObserver
+
+
+class ThrottledRenderer(SimulationObserver):
+    """
+    Rich progress display that is decoupled from the simulation loop.
+
+    The event hooks only bump counters. A separate thread samples them at a
+    fixed frame rate and redraws, so simulation throughput does not depend on
+    the terminal. Small workloads get one bar per process; larger ones are
+    aggregated into summary bars for completed processes and executed work.
+    Use as a context manager around the simulation run.
+
+    Args:
+        console: Rich console to draw on.
+        total_processes (int): Number of processes, or None if unknown (streamed).
+        total_work (int): Total burst time, or None if unknown.
+        fps (float): Frames per second.
+        max_process_bars (int): Largest workload that still gets per-process bars.
+    """
+
+    def __init__(self, console, total_processes=None, total_work=None, fps=10, max_process_bars=20):
+        self.console = console
+        self.total_processes = total_processes
+        self.total_work = total_work
+        self.frame_interval = 1 / fps
+        self.per_process = total_processes is not None and total_processes <= max_process_bars
+
+        self.clock = 0
+        self.arrived = 0
+        self.completed = 0
+        self.executed = 0
+        self.process_info = {}  # pid -> [executed, burst, description] for per-process bars
+
+        self._progress = None
+        self._tasks = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def on_arrival(self, process, time):
+        self.clock = time
+        self.arrived += 1
+        if self.per_process and process.pid not in self.process_info:
+            self.process_info[process.pid] = [
+                0,
+                process.burst_time,
+                f"Arrival: {process.arrival_time}, Burst: {process.burst_time}, Priority: {process.priority}",
+            ]
+
+    def on_dispatch(self, process, time, duration):
+        self.clock = time
+
+    def on_preempt(self, process, time, executed):
+        self._executed(process, time, executed)
+
+    def on_complete(self, process, time, executed):
+        self._executed(process, time, executed)
+        self.completed += 1
+
+    def on_progress(self, process, executed):
+        """
+        Slice callback for schedulers run outside the event engine (their
+        on_progress argument): a process's first slice counts as its arrival,
+        and the slice that leaves nothing remaining as its completion.
+        """
+        if process.remaining_time + executed == process.burst_time:
+            self.on_arrival(process, process.start_time)
+        if process.remaining_time:
+            self.on_preempt(process, self.clock, executed)
+        else:
+            self.on_complete(process, self.clock, executed)
+
+    def _executed(self, process, time, executed):
+        self.clock = time
+        self.executed += executed
+        if self.per_process:
+            self.process_info[process.pid][0] += executed
+
+    def __enter__(self):
+        # Progress Bar Configuration
+        self._progress = Progress(
+            TextColumn("[bold blue]{task.description}"),
+            BarColumn(),
+            TextColumn("[bold green]{task.fields[info]}"),
+            TimeRemainingColumn(),
+            console=self.console,
+            auto_refresh=False,
+        )
+        self._progress.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._render_loop, name="ThrottledRenderer", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop.set()
+        self._thread.join()
+        self.render()  # Final frame with the end state
+        self._progress.stop()
+
+    def _render_loop(self):
+        while not self._stop.wait(self.frame_interval):
+            self.render()
+
+    def render(self):
+        """
+        Draws one frame from the current counters.
+        """
+        if self.per_process:
+            for pid, (executed, burst, info) in list(self.process_info.items()):
+                if pid not in self._tasks:
+                    self._tasks[pid] = self._progress.add_task(f"[bold yellow]P{pid}[/bold yellow]", total=burst, info=info)
+                self._progress.update(self._tasks[pid], completed=executed)
+        else:
+            if not self._tasks:
+                self._tasks["completed"] = self._progress.add_task("Processes", total=self.total_processes, info="")
+                self._tasks["work"] = self._progress.add_task("CPU work", total=self.total_work, info="")
+            self._progress.update(
+                self._tasks["completed"],
+                completed=self.completed,
+                info=f"{self.completed} done, {self.arrived - self.completed} in flight",
+            )
+            self._progress.update(self._tasks["work"], completed=self.executed, info=f"Clock: {self.clock}")
+        self._progress.refresh()
@@ -0,0 +1,224 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import weakref
+from array import array
+from collections import OrderedDict
+
+from process_table import ProcessTable
+from registry import ScheduleResult, as_workload
+
+CACHE_VERSION = 4  # Bump when cached entries change meaning, so stale disk entries are never hit
+RESULT_FIELDS = ("start_time", "completion_time", "core_id", "order")
+
+
+def workload_hash(workload):
+    """
+    Content hash of a workload's pid, arrival, burst and priority columns.
+
+    Run-time fields are not hashed, so a workload hashes the same before and
+    after it has been simulated.
+    """
+    table = as_workload(workload)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(len(table).to_bytes(8, "little"))
+    for column in (table.pid, table.arrival_time, table.burst_time, table.priority):
+        digest.update(memoryview(column))
+    return digest.hexdigest()
+
+
+def make_key(digest, algorithm, params, **context):
+    """
+    Builds a cache key from a workload hash, an algorithm name, its validated
+    parameters and anything else that changes the result (cores, strategy, ...).
+    """
+    return (CACHE_VERSION, digest, algorithm, tuple(sorted(params.items())), tuple(sorted(context.items())))
+
+
+def result_entry(result, **extras):
+    """
+    Copies the run-time arrays of a ScheduleResult into a cache entry.
+    extras (clock, per-core busy time, ...) are stored alongside.
+    """
+    entry = {field: array(getattr(result, field).typecode, getattr(result, field)) for field in RESULT_FIELDS}
+    entry.update(extras)
+    return entry
+
+
+def restore_result(workload, entry):
+    """
+    Rebuilds a ScheduleResult for workload from a cache entry. The entry's
+    arrays are copied, so the result can be changed without touching the cache.
+    """
+    result = ScheduleResult(workload)
+    for field in RESULT_FIELDS:
+        setattr(result, field, array(entry[field].typecode, entry[field]))
+    result.remaining_time = array("q", [0]) * len(workload)  # Every process ran to completion
+    return result
+
+
+def entry_size(entry):
+    """
+    Approximate memory used by an entry, in bytes.
+    """
+    size = 0
+    for value in entry.values():
+        if isinstance(value, array):
+            size += len(value) * value.itemsize
+        elif hasattr(value, "nbytes"):
+            size += value.nbytes
+        elif isinstance(value, dict):
+            size += entry_size(value)
+        else:
+            size += 64
+    return size
+
+
+class ScheduleCache:
+    """
+    Cache of schedule results keyed by (workload content hash, algorithm, parameters).
+
+    Entries live in an in-memory LRU bounded by their total size in bytes;
+    the least recently used entries are evicted first. With a directory, every
+    entry is also written there, so results survive restarts and are shared
+    with other processes (e.g. sweep workers). Counters for hits, misses and
+    evictions are available through stats().
+
+    Args:
+        max_bytes (int): Memory budget for cached entries.
+        directory (str): Optional on-disk store.
+    """
+
+    def __init__(self, max_bytes=256 * 2**20, directory=None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self._entries = OrderedDict()  # key -> (entry, size), least recently used first
+        self._bytes = 0
+        self._digests = weakref.WeakKeyDictionary()  # ProcessTable -> (length, hash)
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def workload_hash(self, workload):
+        """
+        workload_hash, remembered per ProcessTable. Tables only grow (append,
+        extend), so a cached hash is reused while the length is unchanged.
+        """
+        if not isinstance(workload, ProcessTable):
+            return workload_hash(workload)
+        length, digest = self._digests.get(workload, (None, None))
+        if length != len(workload):
+            digest = workload_hash(workload)
+            self._digests[workload] = (len(workload), digest)
+        return digest
+
+    def get(self, key):
+        """
+        Returns the entry for key, or None on a miss.
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key][0]
+        entry = self._load(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.disk_hits += 1
+        self._remember(key, entry)
+        return entry
+
+    def put(self, key, entry):
+        """
+        Stores an entry in memory (evicting as needed) and on disk.
+        """
+        self._remember(key, entry)
+        if self.directory:
+            self._store(key, entry)
+
+    def run(self, scheduler, workload, **params):
+        """
+        Scheduler.run through the cache: identical workloads and parameters are
+        scheduled once.
+
+        Returns:
+            ScheduleResult: A fresh result, cached or computed.
+        """
+        table = as_workload(workload)
+        key = make_key(self.workload_hash(table), scheduler.name, scheduler.validate(params))
+        entry = self.get(key)
+        if entry is not None:
+            return restore_result(table, entry)
+        result = scheduler.run(table, **params)
+        self.put(key, result_entry(result))
+        return result
+
+    def clear(self):
+        """
+        Empties the in-memory cache (the on-disk store is kept).
+        """
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self):
+        """
+        Returns hit/miss counters and the current memory use.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remember(self, key, entry):
+        size = entry_size(entry)
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key)[1]
+        if size > self.max_bytes:
+            return  # Larger than the whole budget; keep it on disk only
+        self._entries[key] = (entry, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.blake2b(repr(key).encode(), digest_size=20).hexdigest() + ".pkl")
+
+    def _load(self, key):
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key), "rb") as stored:
+                stored_key, entry = pickle.load(stored)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None  # Unreadable or partially written entry, recompute it
+        return entry if stored_key == key else None
+
+    def _store(self, key, entry):
+        # Write to a temporary file first so readers never see a partial entry
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as stored:
+                pickle.dump((key, entry), stored, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
@@ -1,4 +1,7 @@
-import time
+import heapq
+from collections import deque
+
+from engine import priority_ready_queue
 
 def fcfs(processes):
     """
@@ -8,11 +11,11 @@ def fcfs(processes):
     if not processes:
         return []
 
-    processes.sort(key=lambda p: p.arrival_time)  # Sort by arrival time
+    arrivals = sorted(processes, key=lambda p: p.arrival_time)  # Sort by arrival time
     current_time = 0  # Initialize the simulation clock
     completed_processes = []  # List to store completed processes
 
-    for process in processes:
+    for process in arrivals:
         # If CPU is idle, move the clock to the process's arrival time
         if current_time < process.arrival_time:
             current_time = process.arrival_time
@@ -32,59 +35,103 @@ def sjf_non_preemptive(processes):
     """
     Shortest Job First (Non-Preemptive) Scheduling Algorithm.
     Executes processes in the order of shortest burst time among those ready.
+
+    Processes are sorted by arrival once and moved into a heap keyed on
+    (burst_time, arrival_time) as they arrive, so scheduling is O(n log n)
+    and idle gaps are skipped straight to the next arrival.
     """
     if not processes:
         return []
 
+    # Sort by arrival once; the original index breaks ties in input order
+    arrivals = sorted(enumerate(processes), key=lambda item: item[1].arrival_time)
+    ready_queue = []
     completed = []
     current_time = 0
-
-    while processes:
-        # Get processes that have arrived
-        ready_queue = [p for p in processes if p.arrival_time <= current_time]
-
-        if ready_queue:
-            # Select the process with the shortest burst time
-            shortest_job = min(ready_queue, key=lambda p: (p.burst_time, p.arrival_time))
-            processes.remove(shortest_job)
-
-            if current_time < shortest_job.arrival_time:
-                current_time = shortest_job.arrival_time
-            shortest_job.start_time = current_time
-            current_time += shortest_job.burst_time
-            shortest_job.completion_time = current_time
-            shortest_job.calculate_metrics(current_time)
-            completed.append(shortest_job)
-        else:
-            current_time += 1  # If no process is ready, increment time
+    next_arrival = 0
+
+    while next_arrival < len(arrivals) or ready_queue:
+        # If CPU is idle, jump the clock to the next arrival
+        if not ready_queue and current_time < arrivals[next_arrival][1].arrival_time:
+            current_time = arrivals[next_arrival][1].arrival_time
+
+        # Move processes that have arrived into the ready heap
+        while next_arrival < len(arrivals) and arrivals[next_arrival][1].arrival_time <= current_time:
+            index, process = arrivals[next_arrival]
+            heapq.heappush(ready_queue, (process.burst_time, process.arrival_time, index, process))
+            next_arrival += 1
+
+        # Select the process with the shortest burst time
+        shortest_job = heapq.heappop(ready_queue)[3]
+        shortest_job.start_time = current_time
+        current_time += shortest_job.burst_time
+        shortest_job.completion_time = current_time
+        shortest_job.calculate_metrics(current_time)
+        completed.append(shortest_job)
 
     return completed
 
-def round_robin(processes, time_quantum, progress=None, task_map=None):
+def srtf(processes):
+    """
+    Shortest Remaining Time First (Preemptive SJF) Scheduling Algorithm.
+    Executes the ready process with the least remaining time.
+
+    The ready heap is keyed on (remaining_time, arrival_time), and an arriving
+    process preempts the running one when it has less time left (see
+    _preemptive).
     """
-    Round Robin (RR) Scheduling Algorithm with optional visualized progress.
+    return _preemptive(processes, lambda process, ready_time: process.remaining_time)
+
+def round_robin(processes, time_quantum, on_progress=None):
+    """
+    Round Robin (RR) Scheduling Algorithm.
     Executes processes in time slices of the given quantum.
+
+    Processes join the ready deque when they arrive, and each slice advances
+    the clock by min(remaining_time, time_quantum) in a single step. Processes
+    arriving during a slice are queued ahead of the preempted process.
+
+    Args:
+        processes (list): List of Process objects.
+        time_quantum (int): Length of each time slice.
+        on_progress (function): Optional callback(process, executed) run after each slice.
+
+    Returns:
+        list: Completed processes in completion order.
     """
     if not processes or time_quantum <= 0:
         return []
 
-    queue = processes[:]
+    arrivals = sorted(processes, key=lambda p: p.arrival_time)  # Sort by arrival time
+    queue = deque()
     current_time = 0
     completed = []
+    next_arrival = 0
+
+    while next_arrival < len(arrivals) or queue:
+        # If CPU is idle, jump the clock to the next arrival
+        if not queue and current_time < arrivals[next_arrival].arrival_time:
+            current_time = arrivals[next_arrival].arrival_time
 
-    while queue:
-        process = queue.pop(0)
+        while next_arrival < len(arrivals) and arrivals[next_arrival].arrival_time <= current_time:
+            queue.append(arrivals[next_arrival])
+            next_arrival += 1
+
+        process = queue.popleft()
         if process.start_time is None:
-            process.start_time = max(current_time, process.arrival_time)
+            process.start_time = current_time
 
+        # Execute the whole slice at once
         time_to_execute = min(process.remaining_time, time_quantum)
-        for _ in range(time_to_execute):
-            current_time += 1
-            process.remaining_time -= 1
-            if progress and task_map:
-                progress.advance(task_map[process.pid], 1)  # Update progress bar
-                progress.refresh()  # Force refresh
-            time.sleep(0.1)  # Simulate real-time execution
+        current_time += time_to_execute
+        process.remaining_time -= time_to_execute
+        if on_progress:
+            on_progress(process, time_to_execute)
+
+        # Admit processes that arrived during the slice
+        while next_arrival < len(arrivals) and arrivals[next_arrival].arrival_time <= current_time:
+            queue.append(arrivals[next_arrival])
+            next_arrival += 1
 
         if process.remaining_time == 0:
             process.completion_time = current_time
@@ -99,46 +146,143 @@ def priority_non_preemptive(processes):
     """
     Priority Scheduling Non-Preemptive Algorithm.
     Executes the process with the highest priority among those ready.
+
+    Arrived processes go into a bucketed ready queue (one FIFO per priority
+    level plus a bitmap of non-empty levels), so each dispatch is constant
+    time for small priority ranges. Idle gaps skip to the next arrival.
     """
     if not processes:
         return []
 
+    arrivals = sorted(processes, key=lambda p: p.arrival_time)  # Sort by arrival time
+    ready_queue = priority_ready_queue(arrivals)
     completed = []
     current_time = 0
+    next_arrival = 0
+
+    while next_arrival < len(arrivals) or ready_queue:
+        # If CPU is idle, jump the clock to the next arrival
+        if not ready_queue and current_time < arrivals[next_arrival].arrival_time:
+            current_time = arrivals[next_arrival].arrival_time
+
+        # Move processes that have arrived into their priority level
+        while next_arrival < len(arrivals) and arrivals[next_arrival].arrival_time <= current_time:
+            ready_queue.push(arrivals[next_arrival], current_time)
+            next_arrival += 1
+
+        # Select the process with the highest priority (lower value = higher priority)
+        highest_priority = ready_queue.pop(current_time)
+        highest_priority.start_time = current_time
+        current_time += highest_priority.burst_time
+        highest_priority.completion_time = current_time
+        highest_priority.calculate_metrics(current_time)
+        completed.append(highest_priority)
+
+    return completed
+
+def priority_preemptive(processes, aging_interval=10):
+    """
+    Priority Scheduling Preemptive Algorithm with aging.
+    Executes the ready process with the best effective priority, preempting the
+    running process when a better one arrives.
+
+    A waiting process gains one priority level every aging_interval time units:
+    effective priority = priority - (current_time - ready_time) / aging_interval.
+    Because every waiting process ages at the same rate, the order is fixed by
+    priority * aging_interval + ready_time, so aging is applied lazily through
+    the heap key instead of rewriting waiting processes. The running process
+    is re-keyed at dispatch (priority * aging_interval + dispatch_time), so
+    aging earned while waiting does not carry into its run and it only ages
+    from its dispatch; a preempted process re-enters the heap with a fresh
+    ready_time.
+    """
+    return _preemptive(processes, lambda process, ready_time: process.priority * aging_interval + ready_time)
+
+def _preemptive(processes, key):
+    """
+    Shared loop of the preemptive schedulers (SRTF, Priority with aging).
+
+    Runs the ready process with the smallest key(process, ready_time), where
+    ready_time is when it arrived or was preempted; ties go to the earlier
+    arrival, then to input order. The running process can only be preempted
+    when a new process arrives, so the clock jumps from one arrival or
+    completion to the next and the ready heap is consulted only then. An
+    arrival preempts when its key is smaller than the running process's
+    key(process, dispatch_time).
+    """
+    if not processes:
+        return []
 
-    while processes:
-        # Get processes that have arrived
-        ready_queue = [p for p in processes if p.arrival_time <= current_time]
-
-        if ready_queue:
-            # Select the process with the highest priority (lower value = higher priority)
-            highest_priority = min(ready_queue, key=lambda p: (p.priority, p.arrival_time))
-            processes.remove(highest_priority)
-
-            if current_time < highest_priority.arrival_time:
-                current_time = highest_priority.arrival_time
-            highest_priority.start_time = current_time
-            current_time += highest_priority.burst_time
-            highest_priority.completion_time = current_time
-            highest_priority.calculate_metrics(current_time)
-            completed.append(highest_priority)
+    # Sort by arrival once; the original index breaks ties in input order
+    arrivals = sorted(enumerate(processes), key=lambda item: item[1].arrival_time)
+    ready_queue = []
+    completed = []
+    current_time = 0
+    next_arrival = 0
+    running = None  # (index, process) on the CPU
+    dispatch_time = None
+
+    def admit_arrivals():
+        nonlocal next_arrival
+        while next_arrival < len(arrivals) and arrivals[next_arrival][1].arrival_time <= current_time:
+            index, process = arrivals[next_arrival]
+            heapq.heappush(ready_queue, (key(process, process.arrival_time), process.arrival_time, index, process))
+            next_arrival += 1
+
+    while next_arrival < len(arrivals) or ready_queue or running:
+        if running is None:
+            # If CPU is idle, jump the clock to the next arrival
+            if not ready_queue and current_time < arrivals[next_arrival][1].arrival_time:
+                current_time = arrivals[next_arrival][1].arrival_time
+            admit_arrivals()
+
+            running = heapq.heappop(ready_queue)[2:]
+            dispatch_time = current_time
+            if running[1].start_time is None:
+                running[1].start_time = current_time
+
+        index, process = running
+        finish_time = current_time + process.remaining_time
+
+        if next_arrival < len(arrivals) and arrivals[next_arrival][1].arrival_time < finish_time:
+            # Run until the next arrival, then check whether it preempts
+            arrival_time = arrivals[next_arrival][1].arrival_time
+            process.remaining_time -= arrival_time - current_time
+            current_time = arrival_time
+            admit_arrivals()
+
+            if ready_queue[0][0] < key(process, dispatch_time):
+                heapq.heappush(ready_queue, (key(process, current_time), process.arrival_time, index, process))
+                running = None
         else:
-            current_time += 1  # If no process is ready, increment time
+            # No arrival before completion, run to the end
+            current_time = finish_time
+            process.remaining_time = 0
+            process.completion_time = current_time
+            process.calculate_metrics(current_time)
+            completed.append(process)
+            running = None
 
     return completed
 
-def mlfq(self, processes, progress=None, task_map=None, num_queues=3, base_time_quantum=4, time_quantums=None, algorithms=None):
+def mlfq(processes, num_queues=3, base_time_quantum=4, time_quantums=None, algorithms=None,
+         boost_interval=50, on_progress=None):
     """
-    Multi-Level Feedback Queue (MLFQ) Scheduling Algorithm with Rich Visualization.
+    Multi-Level Feedback Queue (MLFQ) Scheduling Algorithm.
+
+    New processes enter the highest-priority queue. A process that uses its
+    whole slice is demoted one level, and every boost_interval time units all
+    waiting processes are moved back to the top queue so long jobs cannot
+    starve. Each slice advances the clock in a single step.
 
     Args:
         processes: List of Process objects.
-        progress: Rich progress object for visualization.
-        task_map: Mapping of process IDs to Rich progress tasks.
         num_queues: Number of priority queues.
         base_time_quantum: Base time quantum for the highest-priority queue.
         time_quantums: List of time quanta for each queue.
-        algorithms: List of algorithms for each queue (e.g., round_robin, sjf, fcfs).
+        algorithms: List of algorithms for each queue ("round_robin" or "fcfs").
+        boost_interval: Time units between priority boosts (None or 0 disables boosting).
+        on_progress: Optional callback(process, executed) run after each slice.
 
     Returns:
         List of completed processes.
@@ -150,60 +294,62 @@ def mlfq(self, processes, progress=None, task_map=None, num_queues=3, base_time_
     time_quantums = time_quantums or [base_time_quantum * (i + 1) for i in range(num_queues)]
     algorithms = algorithms or ["round_robin"] * num_queues  # Default to Round Robin for all queues
 
-    queues = [[] for _ in range(num_queues)]
+    arrivals = sorted(processes, key=lambda p: p.arrival_time)  # Sort by arrival time
+    queues = [deque() for _ in range(num_queues)]
+    waiting = 0  # Number of processes across all queues
     current_time = 0
+    next_arrival = 0
+    next_boost = boost_interval if boost_interval else None
     completed = []
 
-    # Initially place all processes in Queue 1 (highest priority)
-    for process in processes:
-        queues[0].append(process)
-
-    # Process each queue and simulate execution
-    while any(queue for queue in queues):
-        for level, queue in enumerate(queues):
-            time_quantum = time_quantums[level]  # Get the time quantum for the current queue
-            algorithm = algorithms[level]  # Get the algorithm for the current queue
-
-            while queue:
-                process = queue.pop(0)
-                if process.start_time is None:
-                    process.start_time = max(current_time, process.arrival_time)
-
-                task = task_map.get(process.pid) if task_map else None
-
-                # Execute the process based on the selected algorithm
-                if algorithm == "round_robin":
-                    time_to_execute = min(process.remaining_time, time_quantum)
-                    for _ in range(time_to_execute):
-                        process.remaining_time -= 1
-                        current_time += 1
-                        if task and progress:
-                            progress.advance(task, 1)
-                            progress.refresh()
-                        time.sleep(0.1)  # Simulate real-time execution
-
-                # Implement SJF, FCFS, or other algorithms similarly...
-
-                # Process completion
-                if process.remaining_time == 0:
-                    process.completion_time = current_time
-                    process.calculate_metrics(current_time)
-                    completed.append(process)
-                else:
-                    if level < num_queues - 1:
-                        queues[level + 1].append(process)
-                    else:
-                        queue.append(process)
-
-                # Update the queue states dynamically for visualization
-                if progress:
-                    queue_states = "\n".join(
-                        f"Queue {i + 1}: {[p.pid for p in q]}" for i, q in enumerate(queues)
-                    )
-                    progress.console.clear()
-                    progress.console.print(queue_states)
+    while next_arrival < len(arrivals) or waiting:
+        # If CPU is idle, jump the clock to the next arrival
+        if not waiting and current_time < arrivals[next_arrival].arrival_time:
+            current_time = arrivals[next_arrival].arrival_time
 
-    return completed
+        # New arrivals enter Queue 1 (highest priority)
+        while next_arrival < len(arrivals) and arrivals[next_arrival].arrival_time <= current_time:
+            queues[0].append(arrivals[next_arrival])
+            next_arrival += 1
+            waiting += 1
 
+        level = next(i for i, queue in enumerate(queues) if queue)
+        process = queues[level].popleft()
+        waiting -= 1
+        if process.start_time is None:
+            process.start_time = current_time
 
+        # FCFS levels run to completion, Round Robin levels for one quantum
+        if algorithms[level] == "fcfs":
+            time_to_execute = process.remaining_time
+        else:
+            time_to_execute = min(process.remaining_time, time_quantums[level])
+        current_time += time_to_execute
+        process.remaining_time -= time_to_execute
+        if on_progress:
+            on_progress(process, time_to_execute)
+
+        # Admit processes that arrived during the slice
+        while next_arrival < len(arrivals) and arrivals[next_arrival].arrival_time <= current_time:
+            queues[0].append(arrivals[next_arrival])
+            next_arrival += 1
+            waiting += 1
+
+        # Priority boost: move every waiting process back to Queue 1
+        boosted = next_boost is not None and current_time >= next_boost
+        if boosted:
+            for lower in queues[1:]:
+                queues[0].extend(lower)
+                lower.clear()
+            next_boost = (current_time // boost_interval + 1) * boost_interval  # Skip idle gaps in one step
+
+        # Process completion, otherwise demote (or return to Queue 1 after a boost)
+        if process.remaining_time == 0:
+            process.completion_time = current_time
+            process.calculate_metrics(current_time)
+            completed.append(process)
+        else:
+            queues[0 if boosted else min(level + 1, num_queues - 1)].append(process)
+            waiting += 1
 
+    return completed
@@ -1,101 +1,421 @@
-import time
-import random
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
+import heapq
+import os
 from process import Process
-from scheduler import fcfs, sjf_non_preemptive, round_robin, priority_non_preemptive
-from metrics import display_metrics
 from rich.console import Console
-from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
-from process import Process
-from scheduler import fcfs, sjf_non_preemptive, round_robin, priority_non_preemptive
-import time
 from logger import Logger
 from core import Core
+import multicore
+from engine import EventEngine, MultiObserver, SimulationObserver, WorkStealingReadyQueue
+from trace_loader import TraceReader, iter_trace
+from contextlib import nullcontext
+from process_table import ProcessTable
+from workload import generate_workload
+from streaming_metrics import MetricsAccumulator
+from renderer import ThrottledRenderer
+from timeline import TimelineRecorder, plot_gantt
+from registry import ScheduleResult, as_workload, get_scheduler
+from result_cache import make_key, restore_result, result_entry, workload_hash
+from checkpoint import TableArrivals, read_checkpoint, write_checkpoint
+
+
+class LoggingObserver(SimulationObserver):
+    """
+    Logs each process as soon as the event engine completes it.
+    """
+
+    def __init__(self, simulator):
+        self.simulator = simulator
+
+    def on_complete(self, process, time, executed):
+        self.simulator.log_process(process)
 
 class CPUSimulator:
-    def __init__(self, num_cores=1):
+    def __init__(self, num_cores=1, logger=None):
         self.num_cores = num_cores
         self.cores = [Core(core_id=i) for i in range(num_cores)]  # Initialize cores
         self.ready_queue = []  # Shared ready queue
         self.completed_processes = []  # Shared completed processes
         self.next_pid = 1  # For assigning process IDs dynamically
-        self.algorithm = None  # Scheduling algorithm
-        self.time_quantum = None  # Time quantum needed for Round Robin
+        self.algorithm = None  # Registered Scheduler (see registry.py)
+        self.algorithm_params = {}  # Validated parameters of the algorithm, e.g. the Round Robin time quantum
         self.global_clock = 0  # Initialize global clock
+        self.core_busy_time = [0] * num_cores  # Busy time per core in the last simulation
+        self.work_stealing = None  # Victim policy ('random' / 'most_loaded') for per-core deques
+        self.work_stealing_seed = None  # Seed for random victims; None gives a run that cannot be repeated
+        self.steal_stats = None  # Steal count and stolen work from the last work-stealing run
+        self.strategy = None  # Strategy the last run actually used: 'shared', 'work_stealing', 'round_robin' or 'least_loaded'
+        self.metrics = None  # Streaming metrics accumulator fed during the last simulation
+        self.record_timeline = False  # Record per-core execution segments during simulate() (not for streamed traces)
+        self.timeline = None  # TimelineRecorder from the last simulation, if recorded
+        self.cache = None  # Optional result_cache.ScheduleCache; identical runs are then simulated once
 
         self.console = Console()
-        self.logger = Logger()
+        self.logger = logger or Logger()  # e.g. batch_logger.BufferedLogger for large runs
         
     def add_process(self, process):
         """
-        Adds a new process to the ready queue and logs the event.
+        Adds a new process to the ready queue and logs the event. A loaded trace
+        is replaced by the new process, as generate_processes does.
         """
+        if self.is_streaming():
+            self.console.print("[bold yellow]Replacing the loaded trace with manually added processes.[/bold yellow]")
+            self.ready_queue = []
         self.ready_queue.append(process)
         self.console.print(
             f"At time [bold blue]{self.global_clock}[/bold blue]: Process [bold yellow]P{process.pid}[/bold yellow] added to the ready queue."
         )
 
-    def simulate(self):
+    def load_process_table(self, table):
+        """
+        Uses a ProcessTable as the ready queue. The schedulers read it through
+        its per-process views, and later add_process calls append to it.
+        """
+        self.ready_queue = table
+        self.next_pid = max(table.pid, default=0) + 1
+        self.console.print(f"[bold green]{len(table)} processes loaded into the ready queue.[/bold green]")
+
+    def generate_processes(self, num_processes, seed=None, **options):
+        """
+        Adds a synthetic workload generated in one NumPy batch (see workload.generate_workload),
+        without printing anything per process.
         """
-        Simulates the selected scheduling algorithm with progress bars and logging.
+        table = generate_workload(num_processes, seed=seed, first_pid=self.next_pid, **options)
+        if isinstance(self.ready_queue, ProcessTable):
+            self.ready_queue.extend(table)
+        elif self.ready_queue and not self.is_streaming():
+            self.ready_queue = ProcessTable.from_processes(self.ready_queue)
+            self.ready_queue.extend(table)
+        else:
+            self.ready_queue = table
+        self.next_pid += num_processes
+        self.console.print(f"[bold green]{num_processes} generated processes have been added to the ready queue.[/bold green]")
+
+    def load_trace(self, path):
+        """
+        Streams processes from a CSV/JSONL trace sorted by arrival time. The trace
+        is read lazily during each simulation and reopened for every run, so
+        start can be repeated on it.
+        """
+        self.ready_queue = iter_trace(path, first_pid=self.next_pid)
+        self.console.print(f"[bold green]Trace {path} will be streamed into the next simulation.[/bold green]")
+
+    def workload(self):
+        """
+        Returns the processes one run reads: a freshly opened reader for a loaded
+        trace, so every run streams it from the start, or the loaded processes.
+        """
+        if isinstance(self.ready_queue, TraceReader):
+            return iter_trace(self.ready_queue.path, self.ready_queue.first_pid)
+        return self.ready_queue
+
+    def is_streaming(self):
+        """
+        True when the ready queue is a lazily read trace rather than a collection.
+        """
+        return not hasattr(self.ready_queue, "__len__")
+
+    def build_ready_queue(self):
+        """
+        Returns the event-engine ready queue and time quantum for the selected algorithm,
+        or (None, None) if the algorithm has no event-driven equivalent.
+        Work stealing applies to the FIFO-ordered algorithms (FCFS and Round Robin).
+        """
+        ready_queue, time_quantum = self.algorithm.event_queue(self.ready_queue, **self.algorithm_params)
+        if self.work_stealing and self.algorithm.fifo:
+            ready_queue = WorkStealingReadyQueue(
+                self.num_cores, victim=self.work_stealing, seed=self.work_stealing_seed, time_quantum=time_quantum
+            )
+            return ready_queue, time_quantum
+        return ready_queue, time_quantum
+
+    def simulate(self, show_progress=True):
+        """
+        Simulates the selected scheduling algorithm on the discrete-event engine,
+        with optional progress bars and logging. Progress is drawn by a throttled
+        renderer on its own thread; show_progress=False runs fully headless.
+
+        With more than one core, all cores share the global clock and pull from
+        one shared ready queue as they become free (SMP). Algorithms without an
+        event-driven equivalent fall back to simulate_partitioned.
+
+        Loaded workloads are never modified: each run keeps its run-time state in
+        a ScheduleResult, so start can be repeated on the same processes. With a
+        cache, a run identical to an earlier one is loaded instead of simulated.
+        Streamed traces are pulled one arrival at a time and completed processes
+        are logged and released, so memory stays bounded by in-flight processes.
+        Algorithms without an event-driven equivalent read the whole workload.
         """
         self.logger.reset_log()
-        self.console.print(f"Starting simulation using [bold magenta]{self.algorithm.__name__.title()}[/bold magenta]...")
+        self.console.print(f"Starting simulation using [bold magenta]{self.algorithm.title}[/bold magenta]...")
 
         if not self.ready_queue:
             self.console.print("[bold red]No processes in the ready queue to simulate.[/bold red]")
             return
 
-        # Sort the ready queue if needed (specific to the algorithm)
-        if self.algorithm == fcfs:
-            self.ready_queue.sort(key=lambda p: p.arrival_time)
-        elif self.algorithm == sjf_non_preemptive:
-            self.ready_queue.sort(key=lambda p: (p.burst_time, p.arrival_time))
+        streaming = self.is_streaming()
+        ready_queue, time_quantum = self.build_ready_queue()
+        if self.work_stealing and not isinstance(ready_queue, WorkStealingReadyQueue):
+            self.console.print("[bold yellow]Work stealing only applies to FCFS and Round Robin, using the shared ready queue.[/bold yellow]")
 
-        # Execute the selected scheduling algorithm
-        if self.algorithm == round_robin:
-            self.completed_processes = self.algorithm(self.ready_queue, self.time_quantum)
-        else:
-            self.completed_processes = self.algorithm(self.ready_queue)
-
-        # Progress Bar Configuration
-        with Progress(
-            TextColumn("[bold blue]{task.description}"),
-            BarColumn(),
-            TextColumn("[bold green]{task.fields[info]}"),
-            TimeRemainingColumn(),
-            console=self.console,
-        ) as progress:
-            task_map = {}
-
-            # Add tasks to the progress bar
+        if ready_queue is None and self.num_cores > 1:
+            self.console.print("[bold yellow]No shared-queue version of this algorithm, partitioning processes across cores.[/bold yellow]")
+            self.simulate_partitioned()
+            return
+
+        self.strategy = "work_stealing" if isinstance(ready_queue, WorkStealingReadyQueue) else "shared"
+        key = None if streaming else self.cache_key(timeline=self.record_timeline)
+        entry = self.cache.get(key) if key is not None else None
+        if entry is not None:
+            completed_count = self.restore_run(entry)
+        elif ready_queue is None:
+            # No event-driven equivalent, run the scheduling function directly
+            self.metrics = None
+            self.timeline = None
+            self.steal_stats = None
+            # Schedulers that report their slices (MLFQ) feed the throttled renderer
+            renderer = self.renderer(show_progress) if self.algorithm.progress else None
+            with renderer or nullcontext():
+                on_progress = renderer.on_progress if renderer is not None else None
+                result = self.algorithm.run(self.workload(), on_progress=on_progress, **self.algorithm_params)
+            self.completed_processes = result.completed
+            self.global_clock = max((p.completion_time for p in self.completed_processes), default=self.global_clock)
+            self.core_busy_time = self.busy_time_by_core(self.completed_processes)
             for process in self.completed_processes:
-                task = progress.add_task(
-                    f"[bold yellow]P{process.pid}[/bold yellow]",
-                    total=process.burst_time,
-                    info=f"Arrival: {process.arrival_time}, Burst: {process.burst_time}, Priority: {process.priority}",
-                )
-                task_map[process.pid] = task
-
-            # Simulate each process
-            while any(p.remaining_time > 0 for p in self.completed_processes):
-                for process in self.completed_processes:
-                    if process.remaining_time > 0:
-                        progress.advance(task_map[process.pid])
-                        process.remaining_time -= 1
-                        self.global_clock += 1  # Increment global clock
-                        time.sleep(0.5)  # Simulate time unit
-
-                        # Log process details when completed
-                        if process.remaining_time == 0 and process.completion_time is None:
-                            process.completion_time = self.global_clock
-                            process.calculate_metrics(self.global_clock)
-                            self.log_process(process)
+                self.log_process(process)
+            completed_count = len(self.completed_processes)
+        else:
+            self.metrics = MetricsAccumulator()
+            renderer = self.renderer(show_progress)
+            observer = MultiObserver(LoggingObserver(self), self.metrics)
+            # A timeline grows with the trace, so streamed runs keep memory bounded by skipping it
+            self.timeline = TimelineRecorder() if self.record_timeline and not streaming else None
+            if self.timeline is not None:
+                observer = MultiObserver(observer, self.timeline)
+            if renderer is not None:
+                observer = MultiObserver(observer, renderer)
+            with renderer or nullcontext():
+                engine = EventEngine(ready_queue, time_quantum, observer=observer, num_cores=self.num_cores)
+                if streaming:
+                    self.completed_processes = engine.run(self.workload(), retain_completed=False)
+                else:
+                    result = ScheduleResult(as_workload(self.ready_queue))
+                    self.completed_processes = engine.run(result.processes())
+                    result.record(self.completed_processes)
+            self.global_clock = engine.clock
+            self.core_busy_time = engine.core_busy_time
+            if isinstance(ready_queue, WorkStealingReadyQueue):
+                self.steal_stats = {"steals": ready_queue.steals, "stolen_work": ready_queue.stolen_work}
+            else:
+                self.steal_stats = None
+            completed_count = engine.completed_count
 
+        if key is not None and entry is None:
+            self.cache.put(key, self.run_entry(result))
         self.console.print("[bold green]Simulation complete![/bold green]")
+        if streaming:
+            self.console.print(f"[bold blue]{completed_count} streamed processes completed by time {self.global_clock}.[/bold blue]")
         self.analyze_metrics()
 
+    def simulate_checkpointed(self, checkpoint_path, checkpoint_every=100000, resume=False, show_progress=False):
+        """
+        Runs the selected algorithm on the event engine like simulate, saving the
+        complete simulator state to checkpoint_path every checkpoint_every events.
+        With resume=True the run continues from that checkpoint and produces the
+        same log and metrics, bit for bit, as an uninterrupted run.
+
+        A checkpoint holds the clock, pending events, the ready queue (including
+        work-stealing deques and their random generator), per-core state, the
+        metrics accumulator, the position in the workload or trace and the log
+        offset (for loggers with checkpoint/resume, such as BufferedLogger).
+        Completed processes are logged and released instead of kept, so the
+        checkpoint size follows the processes in flight, not the run length.
+        Timelines are not recorded. The checkpoint is removed when the run ends.
+
+        Args:
+            checkpoint_path (str): Checkpoint file.
+            checkpoint_every (int): Events between checkpoints.
+            resume (bool): Continue from checkpoint_path instead of starting over.
+            show_progress (bool): Draw progress bars.
+
+        Raises:
+            ValueError: If the algorithm has no event-driven equivalent, the workload
+                is not a trace file or in-memory collection, or the checkpoint was
+                written for another configuration or workload.
+        """
+        ready_queue, time_quantum = self.build_ready_queue()
+        if ready_queue is None:
+            raise ValueError(f"{self.algorithm.title} has no event-driven equivalent and cannot be checkpointed.")
+        config = self.checkpoint_config()
+        self.strategy = "work_stealing" if isinstance(ready_queue, WorkStealingReadyQueue) else "shared"
+
+        if resume:
+            state = read_checkpoint(checkpoint_path)
+            if state["config"] != config:
+                raise ValueError(f"Checkpoint '{checkpoint_path}' was written for another configuration or workload.")
+            arrivals = self.arrival_stream(state["arrivals"])
+            self.metrics = state["metrics"]
+            if state["log_offset"] is not None:
+                self.logger.resume(state["log_offset"])
+            self.console.print(f"Resuming [bold magenta]{self.algorithm.title}[/bold magenta] at time {state['engine']['clock']}...")
+        else:
+            self.logger.reset_log()
+            arrivals = self.arrival_stream()
+            self.metrics = MetricsAccumulator()
+            self.console.print(f"Starting simulation using [bold magenta]{self.algorithm.title}[/bold magenta]...")
+
+        self.timeline = None
+        renderer = self.renderer(show_progress)
+        observer = MultiObserver(LoggingObserver(self), self.metrics)
+        if renderer is not None:
+            observer = MultiObserver(observer, renderer)
+
+        def save(engine):
+            write_checkpoint(checkpoint_path, {
+                "config": config,
+                "engine": engine.state(),
+                "arrivals": arrivals.position,
+                "metrics": self.metrics,
+                "log_offset": self.logger.checkpoint() if hasattr(self.logger, "checkpoint") else None,
+            })
+
+        with renderer or nullcontext():
+            if resume:
+                engine = EventEngine.from_state(state["engine"], observer=observer)
+                engine.resume(arrivals, retain_completed=False, checkpoint_every=checkpoint_every, on_checkpoint=save)
+            else:
+                engine = EventEngine(ready_queue, time_quantum, observer=observer, num_cores=self.num_cores)
+                engine.run(arrivals, retain_completed=False, checkpoint_every=checkpoint_every, on_checkpoint=save)
+
+        self.completed_processes = []
+        self.global_clock = engine.clock
+        self.core_busy_time = engine.core_busy_time
+        if isinstance(engine.ready_queue, WorkStealingReadyQueue):
+            self.steal_stats = {"steals": engine.ready_queue.steals, "stolen_work": engine.ready_queue.stolen_work}
+        else:
+            self.steal_stats = None
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        self.console.print("[bold green]Simulation complete![/bold green]")
+        self.console.print(f"[bold blue]{engine.completed_count} processes completed by time {self.global_clock}.[/bold blue]")
+        return self.analyze_metrics()
+
+    def checkpoint_config(self):
+        """
+        Describes what a checkpoint belongs to: algorithm, parameters, core setup
+        and workload (trace path, or content hash of an in-memory workload).
+        """
+        if isinstance(self.ready_queue, TraceReader):
+            workload = ("trace", os.path.abspath(self.ready_queue.path), self.ready_queue.first_pid)
+        elif self.is_streaming():
+            raise ValueError("Only trace files and in-memory workloads can be checkpointed.")
+        else:
+            workload = ("table", workload_hash(self.ready_queue))
+        return {
+            "algorithm": self.algorithm.name,
+            "params": self.algorithm_params,
+            "num_cores": self.num_cores,
+            "work_stealing": self.work_stealing,
+            "work_stealing_seed": self.work_stealing_seed,
+            "workload": workload,
+        }
+
+    def arrival_stream(self, position=None):
+        """
+        Returns a resumable stream of the workload's arrivals, starting at a
+        position saved in a checkpoint or at the beginning.
+        """
+        if isinstance(self.ready_queue, TraceReader):
+            return iter_trace(self.ready_queue.path, self.ready_queue.first_pid, position)
+        return TableArrivals(self.ready_queue, position or 0)
+
+    def cache_key(self, **context):
+        """
+        Returns the result-cache key for running the selected algorithm on the
+        loaded workload, or None when there is no cache or the run is not
+        reproducible (streamed traces, work stealing from unseeded random victims).
+        """
+        random_victims = self.work_stealing == "random" and self.algorithm.fifo
+        if self.cache is None or self.is_streaming() or (random_victims and self.work_stealing_seed is None):
+            return None
+        if random_victims:
+            context["work_stealing_seed"] = self.work_stealing_seed
+        return make_key(
+            self.cache.workload_hash(self.ready_queue), self.algorithm.name, self.algorithm_params,
+            num_cores=self.num_cores, work_stealing=self.work_stealing, **context,
+        )
+
+    def run_entry(self, result):
+        """
+        Returns the cache entry for the run that produced result.
+        """
+        return result_entry(
+            result,
+            clock=self.global_clock,
+            core_busy_time=list(self.core_busy_time),
+            steal_stats=self.steal_stats,
+            metrics=self.metrics,
+            timeline=self.timeline.segments() if self.timeline is not None else None,
+        )
+
+    def restore_run(self, entry):
+        """
+        Loads a cached run (completed processes, clock, busy time, steals,
+        metrics accumulator and timeline) and logs the processes as the
+        simulation would have.
+
+        Returns:
+            int: Number of completed processes.
+        """
+        self.completed_processes = restore_result(as_workload(self.ready_queue), entry).completed
+        self.global_clock = entry["clock"]
+        self.core_busy_time = list(entry["core_busy_time"])
+        self.steal_stats = entry["steal_stats"]
+        self.timeline = TimelineRecorder.from_segments(entry["timeline"]) if entry["timeline"] is not None else None
+        self.metrics = entry["metrics"]  # None if the run had no streaming accumulator
+        for process in self.completed_processes:
+            self.log_process(process)
+        self.console.print("[bold blue]Loaded from the schedule cache.[/bold blue]")
+        return len(self.completed_processes)
+
+    def renderer(self, show_progress):
+        """
+        Returns the throttled progress renderer, or None in headless mode.
+        """
+        if not show_progress:
+            return None
+        if self.is_streaming():
+            return ThrottledRenderer(self.console)
+        return ThrottledRenderer(
+            self.console,
+            total_processes=len(self.ready_queue),
+            total_work=sum(p.remaining_time for p in self.ready_queue),
+        )
+
+    def export_timeline(self, path, chart_path=None, max_segments=5000, num_bins=1000):
+        """
+        Saves the timeline of the last simulation and optionally draws it as a Gantt chart.
+
+        Args:
+            path (str): Compressed .npz file for the run-length segments.
+            chart_path (str): Image file for the Gantt chart, or None to skip it.
+            max_segments (int): Above this many segments the chart is binned.
+            num_bins (int): Time bins per core for binned charts.
+
+        Returns:
+            bool: False if the last simulation recorded no timeline.
+        """
+        if self.timeline is None:
+            self.console.print("[bold red]No timeline recorded. Enable timeline recording and run the simulation on an in-memory workload first (streamed traces are not recorded).[/bold red]")
+            return False
+        self.timeline.save(path)
+        self.console.print(f"[bold green]{len(self.timeline)} timeline segments saved to {path}.[/bold green]")
+        if chart_path:
+            binned = plot_gantt(self.timeline.segments(), chart_path, max_segments, num_bins, num_cores=self.num_cores)
+            detail = f" ({num_bins} bins per core)" if binned else ""
+            self.console.print(f"[bold green]Gantt chart written to {chart_path}{detail}.[/bold green]")
+        return True
+
     def log_process(self, process):
         """
         Logs process metrics to the log file.
@@ -110,18 +430,20 @@ class CPUSimulator:
         }
         self.logger.log(process_data)
 
-    def set_algorithm(self, algorithm_name):
+    def set_algorithm(self, algorithm_name, **params):
         """
-        Sets the scheduling algorithm to use.
+        Sets the scheduling algorithm to use, by registry name (see registry.SCHEDULERS).
+
+        Args:
+            algorithm_name (str): e.g. 'fcfs', 'sjf', 'rr', 'priority', 'mlfq'.
+            **params: Values for the parameters the algorithm declares, e.g. time_quantum for 'rr'.
+
+        Raises:
+            ValueError: For unknown algorithms, unknown parameters or invalid values.
         """
-        if algorithm_name == "fcfs":
-            self.algorithm = fcfs
-        elif algorithm_name == "sjf":
-            self.algorithm = sjf_non_preemptive
-        elif algorithm_name == "rr":
-            self.algorithm = round_robin
-        elif algorithm_name == "priority":
-            self.algorithm = priority_non_preemptive
+        algorithm = get_scheduler(algorithm_name)
+        self.algorithm_params = algorithm.validate(params)
+        self.algorithm = algorithm
 
     def randomize_processes(self, num_processes):
         import random
@@ -144,42 +466,107 @@ class CPUSimulator:
     def analyze_metrics(self):
         """
         Calculates and displays summary metrics for the simulation.
-        """
-        if not self.completed_processes:
-            self.console.print("[bold red]No completed processes to analyze.[/bold red]")
-            return
 
-        total_waiting_time = sum(p.waiting_time for p in self.completed_processes)
-        total_turnaround_time = sum(p.turnaround_time for p in self.completed_processes)
-        total_burst_time = sum(p.burst_time for p in self.completed_processes)
+        Uses the streaming accumulator fed during the last simulation when there
+        is one, otherwise summarizes completed_processes in a single pass.
 
-        # Ensure Total Simulation Time accounts for idle periods
-        earliest_arrival = min(p.arrival_time for p in self.completed_processes)
-        latest_completion = max(p.completion_time for p in self.completed_processes)
-        total_simulation_time = latest_completion - earliest_arrival
+        Returns:
+            dict: The summary metrics, or None if there is nothing to analyze.
+        """
+        accumulator = self.metrics
+        if accumulator is None or not accumulator.count:
+            if not self.completed_processes:
+                self.console.print("[bold red]No completed processes to analyze.[/bold red]")
+                return None
+            accumulator = MetricsAccumulator.from_processes(self.completed_processes)
 
         # Avoid division by zero or negative times
-        if total_simulation_time <= 0:
+        metrics = accumulator.summary(num_cores=self.num_cores)
+        if metrics is None:
             self.console.print("[bold red]Simulation time is invalid.[/bold red]")
-            return
-
-        # Calculate metrics
-        average_waiting_time = total_waiting_time / len(self.completed_processes)
-        average_turnaround_time = total_turnaround_time / len(self.completed_processes)
-        cpu_utilization = (total_burst_time / total_simulation_time) * 100
+            return None
 
         # Display Results
         self.console.print("\n[bold magenta]--- Simulation Metrics ---[/bold magenta]")
-        self.console.print(f"[bold blue]Average Waiting Time:[/bold blue] {average_waiting_time:.2f} units")
-        self.console.print(f"[bold blue]Average Turnaround Time:[/bold blue] {average_turnaround_time:.2f} units")
-        self.console.print(f"[bold blue]CPU Utilization:[/bold blue] {min(cpu_utilization, 100):.2f}%")
+        self.console.print(f"[bold blue]Average Waiting Time:[/bold blue] {metrics['average_waiting_time']:.2f} units")
+        self.console.print(f"[bold blue]Average Turnaround Time:[/bold blue] {metrics['average_turnaround_time']:.2f} units")
+        self.console.print(f"[bold blue]Waiting Time p50 / p95 / p99:[/bold blue] {metrics['p50_waiting_time']:.2f} / {metrics['p95_waiting_time']:.2f} / {metrics['p99_waiting_time']:.2f} units")
+        self.console.print(f"[bold blue]Turnaround Time p50 / p95 / p99:[/bold blue] {metrics['p50_turnaround_time']:.2f} / {metrics['p95_turnaround_time']:.2f} / {metrics['p99_turnaround_time']:.2f} units")
+        self.console.print(f"[bold blue]CPU Utilization:[/bold blue] {metrics['cpu_utilization']:.2f}%")
+        if self.num_cores > 1:
+            self.console.print(f"[bold blue]Makespan:[/bold blue] {accumulator.latest_completion} units")
+            self.console.print(f"[bold blue]Throughput:[/bold blue] {metrics['throughput']:.3f} processes/unit")
+            idle_time = accumulator.latest_completion * self.num_cores - sum(self.core_busy_time)
+            self.console.print(f"[bold blue]Core Idle Time:[/bold blue] {idle_time} units")
+        if self.steal_stats:
+            self.console.print(f"[bold blue]Steals:[/bold blue] {self.steal_stats['steals']} (idle time avoided: {self.steal_stats['stolen_work']} units)")
+            metrics.update(self.steal_stats)
+        return metrics
+
+    def scheduling_function(self):
+        """
+        Returns the selected algorithm with its parameters bound, ready to run on a process list.
+        """
+        return self.algorithm.bind(**self.algorithm_params)
+
+    def busy_time_by_core(self, processes):
+        """
+        Returns the busy time per core of a run without the event engine: the
+        burst times of the processes each core completed (core 0 if a process
+        has no core recorded).
+        """
+        busy_time = [0] * self.num_cores
+        for process in processes:
+            busy_time[process.core_id or 0] += process.burst_time
+        return busy_time
+
+    def simulate_partitioned(self, strategy="round_robin", executor=None, max_workers=None, longest_first=False):
+        """
+        Partitions the ready queue across the cores with a load-balancing strategy
+        and runs the selected algorithm on each core independently.
+
+        Args:
+            strategy (str): Load balancing strategy ('round_robin' or 'least_loaded').
+            executor (str): None, 'process' or 'thread' (see simulate_multicore_execution).
+            max_workers (int): Pool size when an executor is used.
+            longest_first (bool): Assign longest jobs first with 'least_loaded' (LPT).
+        """
+        if not self.ready_queue:
+            self.console.print("[bold red]No processes in the ready queue to simulate.[/bold red]")
+            return
+
+        self.strategy = strategy
+        key = self.cache_key(partitioned=strategy, longest_first=longest_first)
+        entry = self.cache.get(key) if key is not None else None
+        if entry is not None:
+            self.restore_run(entry)
+            self.analyze_metrics()
+            return
+
+        self.metrics = None
+        self.timeline = None
+        self.steal_stats = None
+        # Per-core runs update views of a fresh result, never the loaded workload
+        result = ScheduleResult(as_workload(self.workload()))
+        core_queues = multicore.assign_processes_to_cores(result.processes(), self.num_cores, strategy, longest_first)
+        self.completed_processes = multicore.simulate_multicore_execution(
+            core_queues, self.scheduling_function(), executor=executor, max_workers=max_workers, verbose=False
+        )
+        self.global_clock = max((p.completion_time for p in self.completed_processes), default=self.global_clock)
+        self.core_busy_time = self.busy_time_by_core(self.completed_processes)
+        for process in self.completed_processes:
+            self.log_process(process)
+        if key is not None:
+            self.cache.put(key, self.run_entry(result.record(self.completed_processes)))
+        self.analyze_metrics()
 
     def assign_processes_to_cores(self, strategy="round_robin", algorithms=None):
         """
         Distribute processes across cores and set algorithms.
 
         Args:
-            strategy (str): Load balancing strategy ('round_robin' or 'least_loaded').
+            strategy (str): Load balancing strategy ('round_robin' or 'least_loaded',
+                which balances accumulated burst time).
             algorithms (dict): Optional mapping of core_id to algorithm names.
         """
         # Assign processes using the chosen strategy
@@ -187,9 +574,13 @@ class CPUSimulator:
             for i, process in enumerate(self.ready_queue):
                 self.cores[i % len(self.cores)].add_process(process)
         elif strategy == "least_loaded":
+            # Min-heap of (accumulated burst time, core_id) over the cores' current queues
+            core_loads = [(sum(p.burst_time for p in core.queue), core.core_id) for core in self.cores]
+            heapq.heapify(core_loads)
             for process in self.ready_queue:
-                least_loaded_core = min(self.cores, key=lambda core: len(core.queue))
-                least_loaded_core.add_process(process)
+                load, core_id = core_loads[0]
+                self.cores[core_id].add_process(process)
+                heapq.heapreplace(core_loads, (load + process.burst_time, core_id))
 
         # Set algorithms for each core (if provided)
         if algorithms:
@@ -216,9 +607,8 @@ class CPUSimulator:
             self.set_algorithm("sjf")
             self.console.print("[bold magenta]Optimal algorithm selected: Shortest Job First (SJF).[/bold magenta]")
         elif len(self.ready_queue) > 4:  # Overloaded system
-            self.set_algorithm("rr")
-            self.time_quantum = max(2, sum(burst_times) // len(burst_times))  # Suggested time quantum
-            self.console.print(f"[bold magenta]Optimal algorithm selected: Round Robin with Time Quantum = {self.time_quantum}.[/bold magenta]")
+            self.set_algorithm("rr", time_quantum=max(2, sum(burst_times) // len(burst_times)))  # Suggested time quantum
+            self.console.print(f"[bold magenta]Optimal algorithm selected: Round Robin with Time Quantum = {self.algorithm_params['time_quantum']}.[/bold magenta]")
         else:  # Default fallback
             self.set_algorithm("fcfs")
             self.console.print("[bold magenta]Optimal algorithm selected: First-Come, First-Serve (FCFS).[/bold magenta]")
@@ -0,0 +1,212 @@
+import math
+from collections import deque
+
+from engine import SimulationObserver
+
+
+class RunningStats:
+    """
+    Running count, mean, variance (Welford's method), minimum and maximum.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    @property
+    def variance(self):
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def std_dev(self):
+        return math.sqrt(self.variance)
+
+
+class QuantileSketch:
+    """
+    Fixed-memory streaming quantile sketch with relative-error guarantees.
+
+    Positive values are counted in logarithmic buckets whose width grows with
+    the value, so any quantile is answered within relative_accuracy of the true
+    value. Zero and negative values share one bucket. When more than
+    max_buckets are in use the lowest buckets are merged, which only affects
+    the accuracy of the smallest values.
+
+    Args:
+        relative_accuracy (float): Maximum relative error of a quantile.
+        max_buckets (int): Upper bound on the number of buckets kept.
+    """
+
+    def __init__(self, relative_accuracy=0.01, max_buckets=2048):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.buckets = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value):
+        self.count += 1
+        if value <= 0:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        if len(self.buckets) > self.max_buckets:
+            lowest, second = sorted(self.buckets)[:2]
+            self.buckets[second] += self.buckets.pop(lowest)
+
+    def quantile(self, q):
+        """
+        Returns the value at quantile q (0..1), or None if the sketch is empty.
+        """
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                # Midpoint of the bucket (gamma^(key-1), gamma^key] in relative terms
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+class SlidingWindowThroughput:
+    """
+    Completions per time unit over a sliding window of simulated time.
+
+    The window is split into a fixed number of bins, so memory stays constant
+    however long the simulation runs. Completion times must not decrease.
+
+    Args:
+        window (int): Window length in time units.
+        bins (int): Number of bins the window is split into.
+    """
+
+    def __init__(self, window=100, bins=10):
+        self.window = window
+        self.bins = bins
+        self.bin_width = window / bins
+        self._bins = deque()  # [bin index, completions]
+        self._window_count = 0
+        self.peak = 0.0
+
+    def add(self, time):
+        bin_index = int(time // self.bin_width)
+        while self._bins and self._bins[0][0] <= bin_index - self.bins:
+            self._window_count -= self._bins.popleft()[1]
+        if self._bins and self._bins[-1][0] == bin_index:
+            self._bins[-1][1] += 1
+        else:
+            self._bins.append([bin_index, 1])
+        self._window_count += 1
+        self.peak = max(self.peak, self._window_count / self.window)
+
+    @property
+    def current(self):
+        return self._window_count / self.window
+
+
+class MetricsAccumulator(SimulationObserver):
+    """
+    Incremental simulation metrics, fed at each completion event.
+
+    Keeps running mean and variance plus p50/p95/p99 sketches of waiting and
+    turnaround times and sliding-window throughput, all in constant memory, so
+    metrics never require retaining or re-scanning completed processes.
+    """
+
+    QUANTILES = (0.5, 0.95, 0.99)
+    # Keys of summary(), in order, for writers that need them up front (e.g. CSV headers)
+    SUMMARY_FIELDS = (
+        "processes", "average_waiting_time", "average_turnaround_time", "total_simulation_time",
+        "cpu_utilization", "throughput", "waiting_time_std", "turnaround_time_std",
+        "max_waiting_time", "max_turnaround_time", "window_throughput", "peak_window_throughput",
+    ) + tuple(f"p{round(q * 100)}_{kind}_time" for q in QUANTILES for kind in ("waiting", "turnaround"))
+
+    def __init__(self, throughput_window=100, relative_accuracy=0.01):
+        self.waiting = RunningStats()
+        self.turnaround = RunningStats()
+        self.waiting_sketch = QuantileSketch(relative_accuracy)
+        self.turnaround_sketch = QuantileSketch(relative_accuracy)
+        self.throughput = SlidingWindowThroughput(throughput_window)
+        self.total_burst_time = 0
+        self.earliest_arrival = None
+        self.latest_completion = None
+
+    @classmethod
+    def from_processes(cls, processes, **options):
+        """
+        Builds an accumulator from already completed processes in one pass.
+        """
+        accumulator = cls(**options)
+        for process in sorted(processes, key=lambda p: p.completion_time):
+            accumulator.add(process)
+        return accumulator
+
+    @property
+    def count(self):
+        return self.waiting.count
+
+    def on_complete(self, process, time, executed):
+        self.add(process)
+
+    def add(self, process):
+        self.waiting.add(process.waiting_time)
+        self.turnaround.add(process.turnaround_time)
+        self.waiting_sketch.add(process.waiting_time)
+        self.turnaround_sketch.add(process.turnaround_time)
+        self.throughput.add(process.completion_time)
+        self.total_burst_time += process.burst_time
+        if self.earliest_arrival is None or process.arrival_time < self.earliest_arrival:
+            self.earliest_arrival = process.arrival_time
+        if self.latest_completion is None or process.completion_time > self.latest_completion:
+            self.latest_completion = process.completion_time
+
+    def summary(self, num_cores=1):
+        """
+        Returns the aggregate metrics as a dict, or None if nothing has completed
+        or the simulated time span is not positive.
+        """
+        if not self.count:
+            return None
+        # Ensure Total Simulation Time accounts for idle periods
+        total_simulation_time = self.latest_completion - self.earliest_arrival
+        if total_simulation_time <= 0:
+            return None
+
+        metrics = {
+            "processes": self.count,
+            "average_waiting_time": self.waiting.mean,
+            "average_turnaround_time": self.turnaround.mean,
+            "total_simulation_time": total_simulation_time,
+            "cpu_utilization": min(self.total_burst_time / (total_simulation_time * num_cores) * 100, 100),
+            "throughput": self.count / total_simulation_time,
+            "waiting_time_std": self.waiting.std_dev,
+            "turnaround_time_std": self.turnaround.std_dev,
+            "max_waiting_time": self.waiting.maximum,
+            "max_turnaround_time": self.turnaround.maximum,
+            "window_throughput": self.throughput.current,
+            "peak_window_throughput": self.throughput.peak,
+        }
+        for q in self.QUANTILES:
+            label = f"p{round(q * 100)}"
+            metrics[f"{label}_waiting_time"] = self.waiting_sketch.quantile(q)
+            metrics[f"{label}_turnaround_time"] = self.turnaround_sketch.quantile(q)
+        return metrics
@@ -0,0 +1,169 @@
+import argparse
+import csv
+import json
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from batch_logger import NullLogger
+from process_table import ProcessTable
+from result_cache import ScheduleCache
+from simulation import CPUSimulator
+from streaming_metrics import MetricsAccumulator
+
+CONFIG_FIELDS = ("algorithm", "time_quantum", "num_cores", "strategy")
+# Every column a result row can have; steal counts are only filled for work-stealing runs
+RESULT_FIELDS = CONFIG_FIELDS + MetricsAccumulator.SUMMARY_FIELDS + ("steals", "stolen_work", "wall_time")
+
+# Workload and result cache shared by every run in a worker process, set once by the pool initializer
+_shared_workload = None
+_shared_cache = None
+
+
+def build_grid(algorithms, time_quantums=(None,), core_counts=(1,), strategies=("shared",)):
+    """
+    Expands the parameter grid into a list of configurations.
+
+    Time quanta only vary for Round Robin and strategies only vary for more
+    than one core, so configurations that would give identical runs appear once.
+    Strategy 'shared' runs the cores against one shared ready queue and
+    'work_stealing' gives each core its own deque with stealing; the others are
+    load-balancing strategies for partitioned runs.
+
+    Returns:
+        list: Configuration dicts with algorithm, time_quantum, num_cores and strategy.
+    """
+    grid = []
+    seen = set()
+    for algorithm in algorithms:
+        for time_quantum in time_quantums:
+            for num_cores in core_counts:
+                for strategy in strategies:
+                    config = (
+                        algorithm,
+                        time_quantum if algorithm == "rr" else None,
+                        num_cores,
+                        strategy if num_cores > 1 else None,
+                    )
+                    if config not in seen:
+                        seen.add(config)
+                        grid.append(dict(zip(CONFIG_FIELDS, config)))
+    return grid
+
+
+def run_configuration(workload, config, cache=None):
+    """
+    Runs one configuration on the workload.
+
+    Args:
+        workload (ProcessTable): Shared workload; it is never modified.
+        config (dict): One entry of build_grid.
+        cache (ScheduleCache): Optional result cache; cached configurations are not re-simulated.
+
+    Returns:
+        dict: The configuration, its summary metrics and the wall time in seconds.
+    """
+    # Rows only need the metrics; a shared log file would be truncated under the other workers
+    simulator = CPUSimulator(num_cores=config["num_cores"], logger=NullLogger())
+    simulator.console.quiet = True
+    simulator.cache = cache
+    simulator.load_process_table(workload)
+    params = {"time_quantum": config["time_quantum"]} if config["time_quantum"] is not None else {}
+    simulator.set_algorithm(config["algorithm"], **params)
+    if config["strategy"] == "work_stealing":
+        simulator.work_stealing = "most_loaded"
+
+    start = time.perf_counter()
+    if config["num_cores"] == 1 or config["strategy"] in ("shared", "work_stealing"):
+        simulator.simulate(show_progress=False)
+    else:
+        simulator.simulate_partitioned(strategy=config["strategy"])
+    wall_time = time.perf_counter() - start
+
+    return {**config, **(simulator.analyze_metrics() or {}), "wall_time": wall_time}
+
+
+def _init_worker(workload, cache_dir):
+    global _shared_workload, _shared_cache
+    _shared_workload = workload
+    _shared_cache = ScheduleCache(directory=cache_dir) if cache_dir else None
+
+
+def _run_shared(config):
+    return run_configuration(_shared_workload, config, _shared_cache)
+
+
+def run_sweep(workload, grid, output_path, max_workers=None, cache_dir=None):
+    """
+    Runs every configuration of the grid on a process pool and streams one
+    result row per configuration to output_path as soon as it finishes.
+
+    The workload is sent to each worker once, through the pool initializer,
+    rather than once per configuration. Rows are written as JSON lines when
+    output_path ends in .jsonl and as CSV otherwise; CSV files have a fixed
+    header (RESULT_FIELDS), with empty cells for metrics a run does not have.
+
+    Args:
+        workload (ProcessTable): Workload shared by every run.
+        grid (list): Configurations from build_grid.
+        output_path (str): CSV or JSONL file to write.
+        max_workers (int): Pool size; defaults to the number of host cores.
+        cache_dir (str): Optional on-disk schedule cache, so rerunning a sweep
+            only simulates configurations (or workloads) that changed.
+
+    Returns:
+        list: The result rows, in completion order.
+    """
+    rows = []
+    as_jsonl = output_path.endswith(".jsonl")
+    with open(output_path, "w", newline="") as output, ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(workload, cache_dir)
+    ) as pool:
+        writer = None if as_jsonl else csv.DictWriter(output, fieldnames=RESULT_FIELDS)
+        if writer is not None:
+            writer.writeheader()
+        futures = [pool.submit(_run_shared, config) for config in grid]
+        for future in as_completed(futures):
+            row = future.result()
+            rows.append(row)
+            if as_jsonl:
+                output.write(json.dumps(row) + "\n")
+            else:
+                writer.writerow(row)
+            output.flush()  # Keep partial results if an overnight run is interrupted
+    return rows
+
+
+def random_workload(num_processes, seed=None):
+    """
+    Generates the same kind of workload as CPUSimulator.randomize_processes, reproducibly.
+    """
+    rng = random.Random(seed)
+    return ProcessTable.from_arrays(
+        [rng.randint(0, 10) for _ in range(num_processes)],
+        [rng.randint(1, 10) for _ in range(num_processes)],
+        [rng.randint(1, 5) for _ in range(num_processes)],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a CPU scheduling parameter sweep.")
+    parser.add_argument("--algorithms", nargs="+", default=["fcfs", "sjf", "rr", "priority"])
+    parser.add_argument("--quanta", nargs="+", type=int, default=[2, 4, 8])
+    parser.add_argument("--cores", nargs="+", type=int, default=[1, 2, 4])
+    parser.add_argument("--strategies", nargs="+", default=["shared", "round_robin", "least_loaded"])
+    parser.add_argument("--processes", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", default="sweep_results.csv")
+    parser.add_argument("--cache-dir", help="Directory for cached schedule results reused across sweeps")
+    args = parser.parse_args()
+
+    grid = build_grid(args.algorithms, args.quanta, args.cores, args.strategies)
+    print(f"Running {len(grid)} configurations on {args.processes} processes...")
+    run_sweep(random_workload(args.processes, args.seed), grid, args.output, args.workers, args.cache_dir)
+    print(f"Results written to {args.output}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+import simulation
+from batch_logger import BufferedLogger
+from simulation import CPUSimulator
+
+
+class Interrupted(Exception):
+    pass
+
+
+def write_trace(path, num_processes=300, seed=7):
+    rng = random.Random(seed)
+    arrival_time = 0
+    with open(path, "w") as trace:
+        trace.write("arrival_time,burst_time,priority\n")
+        for _ in range(num_processes):
+            arrival_time += rng.randint(0, 3)
+            trace.write(f"{arrival_time},{rng.randint(1, 12)},{rng.randint(1, 5)}\n")
+
+
+def run_trace(trace_path, log_path, checkpoint_path, resume=False):
+    logger = BufferedLogger(str(log_path), append=resume)
+    simulator = CPUSimulator(num_cores=2, logger=logger)
+    simulator.console.quiet = True
+    simulator.work_stealing = "random"
+    simulator.work_stealing_seed = 3
+    simulator.set_algorithm("rr", time_quantum=3)
+    simulator.load_trace(str(trace_path))
+    try:
+        return simulator.simulate_checkpointed(str(checkpoint_path), checkpoint_every=50, resume=resume)
+    finally:
+        logger.close()
+
+
+@pytest.mark.parametrize("interrupt_at", ["first", "last"])
+def test_resumed_trace_run_matches_uninterrupted_run(tmp_path, monkeypatch, interrupt_at):
+    trace_path = tmp_path / "trace.csv"
+    write_trace(trace_path)
+
+    saved = []
+    write_checkpoint = simulation.write_checkpoint
+
+    def counting_write(path, state):
+        saved.append(state["arrivals"])
+        return write_checkpoint(path, state)
+
+    monkeypatch.setattr(simulation, "write_checkpoint", counting_write)
+    expected = run_trace(trace_path, tmp_path / "full.jsonl", tmp_path / "full.ck")
+    # The last checkpoints are taken after the whole trace has been read
+    assert saved[-1] == saved[-2]
+    stop_after = 1 if interrupt_at == "first" else len(saved)
+
+    def interrupting_write(path, state):
+        write_checkpoint(path, state)
+        saved.append(state["arrivals"])
+        if len(saved) == stop_after:
+            raise Interrupted
+
+    saved.clear()
+    monkeypatch.setattr(simulation, "write_checkpoint", interrupting_write)
+    with pytest.raises(Interrupted):
+        run_trace(trace_path, tmp_path / "resumed.jsonl", tmp_path / "run.ck")
+
+    monkeypatch.setattr(simulation, "write_checkpoint", write_checkpoint)
+    resumed = run_trace(trace_path, tmp_path / "resumed.jsonl", tmp_path / "run.ck", resume=True)
+
+    assert (tmp_path / "resumed.jsonl").read_bytes() == (tmp_path / "full.jsonl").read_bytes()
+    assert resumed == expected
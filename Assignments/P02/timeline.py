@@ -0,0 +1,198 @@
+from array import array
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from engine import SimulationObserver
+
+FIELDS = ("core", "pid", "start", "end")
+
+
+class TimelineRecorder(SimulationObserver):
+    """
+    Records which process ran on which core, run-length compressed.
+
+    Every dispatch adds a [start, end) segment, unless the same process just
+    ran on the same core up to this instant (e.g. a Round Robin process that
+    is re-dispatched because nothing else is ready), in which case the
+    previous segment is extended. Segments are kept in typed arrays, about
+    32 bytes each, so million-segment runs stay small.
+    """
+
+    def __init__(self):
+        self.columns = {field: array("q") for field in FIELDS}
+        self._last = {}  # core_id -> index of the core's most recent segment
+
+    @classmethod
+    def from_segments(cls, segments):
+        """
+        Builds a recorder holding already recorded segments (see segments()).
+        """
+        recorder = cls()
+        for field in FIELDS:
+            recorder.columns[field].frombytes(np.asarray(segments[field], dtype=np.int64).tobytes())
+        return recorder
+
+    def __len__(self):
+        return len(self.columns["start"])
+
+    def on_dispatch(self, process, time, duration):
+        core_id = process.core_id
+        last = self._last.get(core_id)
+        columns = self.columns
+        if last is not None and columns["pid"][last] == process.pid and columns["end"][last] == time:
+            columns["end"][last] = time + duration
+            return
+        self._last[core_id] = len(columns["start"])
+        columns["core"].append(core_id)
+        columns["pid"].append(process.pid)
+        columns["start"].append(time)
+        columns["end"].append(time + duration)
+
+    def segments(self):
+        """
+        Returns the segments as a dict of NumPy arrays (core, pid, start, end).
+        """
+        return {field: np.frombuffer(column, dtype=np.int64).copy() if column else np.zeros(0, dtype=np.int64)
+                for field, column in self.columns.items()}
+
+    def save(self, path):
+        """
+        Writes the segments to a compressed .npz file (see save_timeline).
+        """
+        save_timeline(self.segments(), path)
+
+
+def save_timeline(segments, path):
+    """
+    Writes timeline segments to a compressed NumPy .npz file.
+
+    Args:
+        segments (dict): Arrays core, pid, start and end of equal length.
+        path (str): Output path; NumPy appends .npz if it is missing.
+    """
+    np.savez_compressed(path, **{field: segments[field] for field in FIELDS})
+
+
+def load_timeline(path):
+    """
+    Reads timeline segments written by save_timeline.
+
+    Returns:
+        dict: Arrays core, pid, start and end.
+    """
+    with np.load(path) as data:
+        return {field: data[field] for field in FIELDS}
+
+
+def bin_utilization(segments, num_bins, num_cores=None):
+    """
+    Aggregates segments into per-core busy fractions over equal time bins.
+
+    Each core's busy time up to t is the total length of its segments ending
+    before t plus the elapsed part of the one running at t, so it is evaluated
+    at every bin edge with a binary search instead of visiting segments.
+
+    Args:
+        segments (dict): Timeline segments.
+        num_bins (int): Number of time bins.
+        num_cores (int): Number of rows; defaults to the highest core id + 1.
+
+    Returns:
+        tuple: (utilization array of shape (num_cores, num_bins) in 0..1, bin edges)
+    """
+    core, start, end = segments["core"], segments["start"], segments["end"]
+    if num_cores is None:
+        num_cores = int(core.max()) + 1 if len(core) else 1
+    t0 = start.min() if len(start) else 0
+    t1 = end.max() if len(end) else 1
+    edges = np.linspace(t0, max(t1, t0 + 1), num_bins + 1)
+    utilization = np.zeros((num_cores, num_bins))
+
+    for core_id in range(num_cores):
+        mask = core == core_id
+        starts, ends = start[mask], end[mask]
+        order = np.argsort(starts, kind="stable")
+        starts, ends = starts[order], ends[order]  # A core runs one segment at a time, so ends are sorted too
+        busy_before = np.concatenate(([0], np.cumsum(ends - starts)))
+
+        finished = np.searchsorted(ends, edges, side="right")
+        busy = busy_before[finished].astype(float)
+        running = finished < len(starts)
+        partial = np.zeros(len(edges))
+        partial[running] = np.clip(edges[running] - starts[finished[running]], 0, None)
+        busy += partial
+        utilization[core_id] = np.diff(busy) / np.diff(edges)
+
+    return utilization, edges
+
+
+def plot_gantt(segments, path=None, max_segments=5000, num_bins=1000, num_cores=None, title="CPU Timeline"):
+    """
+    Draws the timeline as a Gantt chart with one row per core.
+
+    Up to max_segments segments are drawn individually, colored by PID.
+    Larger timelines are binned into num_bins time bins and drawn as a
+    per-core utilization strip, so plotting cost depends on the bin count
+    rather than on the number of segments.
+
+    Args:
+        segments (dict): Timeline segments (TimelineRecorder.segments or load_timeline).
+        path (str): Image file to write; the chart is shown interactively if None.
+        max_segments (int): Largest timeline drawn segment by segment.
+        num_bins (int): Time bins per core for large timelines.
+        num_cores (int): Number of rows; defaults to the highest core id + 1.
+        title (str): Chart title.
+
+    Returns:
+        bool: True if the timeline was binned.
+    """
+    core = segments["core"]
+    if num_cores is None:
+        num_cores = int(core.max()) + 1 if len(core) else 1
+    binned = len(core) > max_segments
+
+    fig, ax = plt.subplots(figsize=(12, 1 + 0.5 * num_cores))
+    if binned:
+        utilization, edges = bin_utilization(segments, num_bins, num_cores)
+        image = ax.imshow(
+            utilization,
+            aspect="auto",
+            interpolation="nearest",
+            cmap="Greens",
+            vmin=0,
+            vmax=1,
+            extent=(edges[0], edges[-1], num_cores - 0.5, -0.5),
+        )
+        fig.colorbar(image, ax=ax, label="Busy fraction")
+        ax.set_title(f"{title} ({len(core)} segments in {num_bins} bins)")
+    else:
+        colors = plt.get_cmap("tab20")
+        for core_id in range(num_cores):
+            mask = core == core_id
+            starts = segments["start"][mask]
+            widths = segments["end"][mask] - starts
+            pids = segments["pid"][mask]
+            ax.broken_barh(
+                list(zip(starts.tolist(), widths.tolist())),
+                (core_id - 0.4, 0.8),
+                facecolors=[colors(pid % 20) for pid in pids.tolist()],
+                edgecolor="black",
+                linewidth=0.3,
+            )
+            if len(core) <= 100:  # Only label small charts
+                for start, width, pid in zip(starts.tolist(), widths.tolist(), pids.tolist()):
+                    ax.text(start + width / 2, core_id, f"P{pid}", ha="center", va="center", fontsize=8)
+        ax.set_title(title)
+
+    ax.set_yticks(range(num_cores))
+    ax.set_yticklabels([f"Core {core_id}" for core_id in range(num_cores)])
+    ax.set_ylim(num_cores - 0.5, -0.5)
+    ax.set_xlabel("Time")
+    fig.tight_layout()
+    if path:
+        fig.savefig(path)
+        plt.close(fig)
+    else:
+        plt.show()
+    return binned
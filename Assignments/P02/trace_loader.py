@@ -0,0 +1,126 @@
+import csv
+import json
+import os
+
+from process import Process
+
+
+class TraceReader:
+    """
+    Lazy, resumable reader for .csv and .jsonl traces.
+
+    Rows are read one line at a time. position is the byte offset and row
+    count after the last process returned, and a reader created with that
+    position continues with the next row, which is how checkpointed runs pick
+    up a trace where they left off. The file is closed once the trace runs
+    out; position then stays at the end of the file. CSV rows must fit on one
+    line.
+
+    Args:
+        path (str): Trace file path.
+        first_pid (int): PID given to the first row when the trace has no pid column.
+        format (str): 'csv' or 'jsonl'.
+        position (tuple): (byte offset, rows read) to resume from, or None to start
+            at the beginning.
+    """
+
+    def __init__(self, path, first_pid=1, format="csv", position=None):
+        if format not in {"csv", "jsonl"}:
+            raise ValueError(f"Unknown trace format '{format}'. Choose 'csv' or 'jsonl'.")
+        self.path = path
+        self.first_pid = first_pid
+        self.format = format
+        self.rows = 0
+        self._fields = None
+        self._end = None  # Final offset, kept once the file is closed
+        self._file = open(path, "rb")
+        if format == "csv":
+            self._fields = next(csv.reader([self._file.readline().decode("utf-8-sig")]), [])
+        if position is not None:
+            offset, self.rows = position
+            self._file.seek(offset)
+
+    @property
+    def position(self):
+        if self._file.closed:
+            return (self._end, self.rows)
+        return (self._file.tell(), self.rows)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._file.closed:
+            raise StopIteration
+        while True:
+            line = self._file.readline()
+            if not line:
+                self._end = self._file.tell()
+                self._file.close()
+                raise StopIteration
+            text = line.decode("utf-8")
+            if text.strip():  # Blank lines are skipped
+                break
+        if self.format == "jsonl":
+            record = json.loads(text)
+        else:
+            record = dict(zip(self._fields, next(csv.reader([text]))))
+        process = _make_process(record, self.first_pid + self.rows)
+        self.rows += 1
+        return process
+
+
+def read_csv_trace(path, first_pid=1):
+    """
+    Lazily yields processes from a CSV trace.
+
+    The file needs a header with arrival_time and burst_time columns, and may
+    also have pid and priority columns (priority defaults to 1, pids are
+    numbered from first_pid when missing). Rows are read one at a time.
+    """
+    return TraceReader(path, first_pid, format="csv")
+
+
+def read_jsonl_trace(path, first_pid=1):
+    """
+    Lazily yields processes from a JSONL trace, one JSON object per line with
+    the same fields as the CSV format. Blank lines are skipped.
+    """
+    return TraceReader(path, first_pid, format="jsonl")
+
+
+def iter_trace(path, first_pid=1, position=None):
+    """
+    Lazily yields processes from a .csv or .jsonl trace file.
+
+    Traces must be sorted by arrival time so the event engine can pull each
+    arrival only when it needs it; memory then stays bounded by the number of
+    in-flight processes rather than by the trace length.
+
+    Args:
+        path (str): Trace file path.
+        first_pid (int): PID given to the first row when the trace has no pid column.
+        position (tuple): TraceReader.position to resume from, or None.
+
+    Returns:
+        TraceReader: Iterator of Process objects in file order.
+    """
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"Trace file '{path}' does not exist.")
+    if path.endswith(".jsonl"):
+        return TraceReader(path, first_pid, "jsonl", position)
+    if path.endswith(".csv"):
+        return TraceReader(path, first_pid, "csv", position)
+    raise ValueError(f"Unsupported trace format '{path}'. Use a .csv or .jsonl file.")
+
+
+def _make_process(record, default_pid):
+    try:
+        return Process(
+            int(record.get("pid") or default_pid),
+            int(record["arrival_time"]),
+            int(record["burst_time"]),
+            int(record.get("priority") or 1),
+        )
+    except (KeyError, ValueError) as error:
+        raise ValueError(f"Invalid trace record {record!r}: {error}") from error
@@ -0,0 +1,140 @@
+import heapq
+
+import numpy as np
+
+
+def serial_completion_times(arrival, burst):
+    """
+    Completion times of jobs run back to back in the given order on one CPU.
+
+    Solves completion[i] = max(completion[i - 1], arrival[i]) + burst[i] with
+    prefix operations: with S the running burst sum,
+    completion[i] = S[i] + max(0, max over j <= i of (arrival[j] - S[j - 1])).
+
+    Args:
+        arrival (np.ndarray): Arrival times in execution order.
+        burst (np.ndarray): Burst times in execution order.
+
+    Returns:
+        np.ndarray: Completion time of each job.
+    """
+    elapsed = np.cumsum(burst)
+    slack = np.maximum.accumulate(arrival - (elapsed - burst))
+    return elapsed + np.maximum(slack, 0)  # Simulation clock starts at 0
+
+
+def fcfs_vectorized(arrival, burst, priority=None):
+    """
+    First-Come, First-Serve (FCFS) over NumPy arrays.
+
+    Args:
+        arrival (np.ndarray): Arrival time of each process.
+        burst (np.ndarray): Burst time of each process.
+        priority (np.ndarray): Unused by FCFS, accepted so every vectorized
+            algorithm takes the same arrays.
+
+    Returns:
+        dict: Per-process arrays and aggregate metrics (see schedule_result).
+    """
+    arrival = np.asarray(arrival)
+    burst = np.asarray(burst)
+    order = np.argsort(arrival, kind="stable")  # Sort by arrival time
+    return schedule_result(arrival, burst, order)
+
+
+def sjf_vectorized(arrival, burst, priority=None):
+    """
+    Shortest Job First (Non-Preemptive) over NumPy arrays.
+
+    The dispatch order needs a heap walk, but once it is known the timing is
+    the same back-to-back recurrence as FCFS: a job picked after an idle gap
+    is the one whose arrival ended the gap. Completion times are therefore
+    computed with the FCFS prefix operations over the dispatch order.
+
+    Args:
+        arrival (np.ndarray): Arrival time of each process.
+        burst (np.ndarray): Burst time of each process.
+        priority (np.ndarray): Unused by SJF.
+
+    Returns:
+        dict: Per-process arrays and aggregate metrics (see schedule_result).
+    """
+    arrival = np.asarray(arrival)
+    burst = np.asarray(burst)
+    by_arrival = np.argsort(arrival, kind="stable")
+    arrivals = arrival[by_arrival].tolist()
+    bursts = burst[by_arrival].tolist()
+    indices = by_arrival.tolist()
+
+    order = []
+    ready_queue = []
+    current_time = 0
+    next_arrival = 0
+    while next_arrival < len(arrivals) or ready_queue:
+        # If CPU is idle, jump the clock to the next arrival
+        if not ready_queue and current_time < arrivals[next_arrival]:
+            current_time = arrivals[next_arrival]
+        while next_arrival < len(arrivals) and arrivals[next_arrival] <= current_time:
+            heapq.heappush(ready_queue, (bursts[next_arrival], arrivals[next_arrival], indices[next_arrival]))
+            next_arrival += 1
+        job_burst, _, index = heapq.heappop(ready_queue)
+        order.append(index)
+        current_time += job_burst
+
+    return schedule_result(arrival, burst, np.array(order, dtype=np.int64))
+
+
+def schedule_result(arrival, burst, order):
+    """
+    Builds per-process and aggregate metrics for a back-to-back execution order.
+
+    Args:
+        arrival (np.ndarray): Arrival time of each process.
+        burst (np.ndarray): Burst time of each process.
+        order (np.ndarray): Indices of the processes in execution order.
+
+    Returns:
+        dict: "order", "start", "completion", "waiting" and "turnaround" arrays
+        (indexed like the inputs) and a "metrics" dict of aggregates.
+    """
+    completion = np.empty_like(burst)
+    completion[order] = serial_completion_times(arrival[order], burst[order])
+    turnaround = completion - arrival
+    waiting = turnaround - burst
+    return {
+        "order": order,
+        "start": completion - burst,
+        "completion": completion,
+        "waiting": waiting,
+        "turnaround": turnaround,
+        "metrics": summarize_metrics(arrival, burst, completion, waiting, turnaround),
+    }
+
+
+def summarize_metrics(arrival, burst, completion, waiting=None, turnaround=None):
+    """
+    Aggregate metrics over process arrays, matching CPUSimulator.analyze_metrics.
+
+    Returns:
+        dict: Averages, total simulation time, CPU utilization (%) and throughput,
+        or an empty dict when there are no processes.
+    """
+    if len(arrival) == 0:
+        return {}
+    if turnaround is None:
+        turnaround = completion - arrival
+    if waiting is None:
+        waiting = turnaround - burst
+
+    # Ensure Total Simulation Time accounts for idle periods
+    total_simulation_time = float(completion.max() - arrival.min())
+    total_burst_time = float(burst.sum())
+    return {
+        "processes": int(len(arrival)),
+        "average_waiting_time": float(waiting.mean()),
+        "average_turnaround_time": float(turnaround.mean()),
+        "max_waiting_time": float(waiting.max()),
+        "total_simulation_time": total_simulation_time,
+        "cpu_utilization": min(total_burst_time / total_simulation_time * 100, 100) if total_simulation_time > 0 else 0.0,
+        "throughput": len(arrival) / total_simulation_time if total_simulation_time > 0 else 0.0,
+    }
@@ -0,0 +1,62 @@
+import numpy as np
+
+from process_table import ProcessTable
+
+
+def generate_workload(num_processes, seed=None, arrival="poisson", arrival_rate=0.5, burst="pareto",
+                      min_burst=1, max_burst=None, pareto_shape=1.5, lognormal_mean=1.5, lognormal_sigma=1.0,
+                      priority_weights=(0.2, 0.2, 0.2, 0.2, 0.2), first_pid=1):
+    """
+    Generates a whole synthetic workload at once with NumPy.
+
+    The same seed always gives the same workload. Nothing is printed per
+    process; the result goes straight into a ProcessTable.
+
+    Args:
+        num_processes (int): Number of processes to generate.
+        seed (int): Seed for the random generator.
+        arrival (str): 'poisson' for exponential inter-arrival times with the given
+            arrival_rate (processes per time unit), or 'uniform' for arrivals in
+            0..10 like CPUSimulator.randomize_processes.
+        arrival_rate (float): Mean number of arrivals per time unit for 'poisson'.
+        burst (str): 'pareto' or 'lognormal' for heavy-tailed bursts, or 'uniform'
+            for bursts in 1..10.
+        min_burst (int): Smallest burst time (the Pareto scale).
+        max_burst (int): Optional cap on burst times.
+        pareto_shape (float): Pareto tail index; smaller means heavier tails.
+        lognormal_mean (float): Mean of the underlying normal for 'lognormal'.
+        lognormal_sigma (float): Standard deviation of the underlying normal.
+        priority_weights (sequence): Probability of priorities 1, 2, ... (normalized).
+        first_pid (int): PID of the first process.
+
+    Returns:
+        ProcessTable: The generated processes, sorted by arrival time.
+    """
+    rng = np.random.default_rng(seed)
+
+    if arrival == "poisson":
+        arrival_times = np.floor(np.cumsum(rng.exponential(1 / arrival_rate, num_processes))).astype(np.int64)
+    elif arrival == "uniform":
+        arrival_times = np.sort(rng.integers(0, 11, num_processes))
+    else:
+        raise ValueError(f"Unknown arrival distribution '{arrival}'. Choose 'poisson' or 'uniform'.")
+
+    if burst == "pareto":
+        burst_times = np.ceil((rng.pareto(pareto_shape, num_processes) + 1) * min_burst)
+    elif burst == "lognormal":
+        burst_times = np.ceil(rng.lognormal(lognormal_mean, lognormal_sigma, num_processes))
+    elif burst == "uniform":
+        burst_times = rng.integers(1, 11, num_processes)
+    else:
+        raise ValueError(f"Unknown burst distribution '{burst}'. Choose 'pareto', 'lognormal' or 'uniform'.")
+    burst_times = np.clip(burst_times, max(min_burst, 1), max_burst).astype(np.int64)
+
+    weights = np.asarray(priority_weights, dtype=float)
+    priorities = rng.choice(np.arange(1, len(weights) + 1), size=num_processes, p=weights / weights.sum())
+
+    return ProcessTable.from_arrays(
+        arrival_times,
+        burst_times,
+        priorities.astype(np.int64),
+        pids=np.arange(first_pid, first_pid + num_processes, dtype=np.int64),
+    )